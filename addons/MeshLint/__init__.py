@@ -1,7 +1,11 @@
+import os
+
 import bpy
 
 from .config import __addon_name__
 from .i18n.dictionary import dictionary
+from .meshLint.MeshLintProfiler import meshlint_gbl_profile_toggle
+from .meshLint.utilities import MIN_CHECK_INTERVAL, TICK_BUDGET_MS
 from ...common.class_loader import auto_load
 from ...common.class_loader.auto_load import add_properties, remove_properties
 from ...common.i18n.dictionary import common_dictionary
@@ -21,7 +25,50 @@ bl_info = {
     "category": "Mesh"
 }
 
-_addon_properties = {}
+_addon_properties = {
+    bpy.types.Scene: {
+        "meshlint_engine": bpy.props.EnumProperty(
+            name="Engine",
+            description="How the checks walk the mesh",
+            items=[
+                ('BMESH', "BMesh", "Visit the BMesh elements one at a time"),
+                ('NUMPY', "NumPy", "Read the topology in bulk and run the checks as array operations"),
+                ('STREAM', "Streaming", "Read the topology in fixed-size chunks, for meshes too large to be read whole"),
+            ],
+            default='BMESH',
+        ),
+        "meshlint_incremental": bpy.props.BoolProperty(
+            name="Incremental",
+            description="In continuous mode, only check again the part of the mesh touched by the last edit",
+            default=False,
+        ),
+        "meshlint_min_interval": bpy.props.FloatProperty(
+            name="Minimum Interval",
+            description="Seconds to wait between two continuous checks, edits made meanwhile are merged into one",
+            default=MIN_CHECK_INTERVAL,
+            min=0.0,
+            soft_max=2.0,
+        ),
+        "meshlint_tick_budget": bpy.props.IntProperty(
+            name="Tick Budget",
+            description="Milliseconds of analysis per timer tick before the viewport gets control back",
+            default=TICK_BUDGET_MS,
+            min=1,
+            soft_max=50,
+        ),
+        "meshlint_histograms": bpy.props.BoolProperty(
+            name="Histograms",
+            description="Keep the vertex valence and face size histograms of the checked objects and show them",
+            default=False,
+        ),
+        "meshlint_profile": bpy.props.BoolProperty(
+            name="Profile",
+            description="Measure the time and element throughput of every lint stage",
+            default=False,
+            update=meshlint_gbl_profile_toggle,
+        ),
+    },
+}
 
 
 # You may declare properties like following, framework will automatically add and remove them.
@@ -33,10 +80,36 @@ _addon_properties = {}
 #     },
 # }
 
+def fast_start():
+    """Register from registration_manifest, unless MESHLINT_DISCOVER is set in the environment: then every module
+    is imported and searched as before, to try new classes without running scripts/meshlint_manifest.py first"""
+    return not os.environ.get("MESHLINT_DISCOVER")
+
+
+def check_keywords():
+    """BoolProperty keywords of the scene toggle of each check, keyed by property name in MeshLintAnalyzer.CHECKS
+    order: from registration_manifest, without importing the analysis, or from MeshLintAnalyzer.CHECKS when the
+    modules are discovered"""
+    if fast_start():
+        from . import registration_manifest
+        return registration_manifest.CHECK_PROPERTIES
+    from .meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+    return MeshLintAnalyzer.check_properties()
+
+
+def check_properties():
+    """The scene toggle of each check"""
+    return {name: bpy.props.BoolProperty(**keywords) for name, keywords in check_keywords().items()}
+
+
 def register():
     # Register classes
-    auto_load.init()
+    manifest = None
+    if fast_start():
+        from . import registration_manifest as manifest
+    auto_load.init(manifest)
     auto_load.register()
+    _addon_properties[bpy.types.Scene].update(check_properties())
     add_properties(_addon_properties)
 
     # Internationalization
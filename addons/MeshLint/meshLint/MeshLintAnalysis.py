@@ -0,0 +1,204 @@
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.utilities import ELEM_TYPES
+
+EMPTY_INDICES = np.empty(0, dtype=np.uint32)
+EMPTY_INDICES.flags.writeable = False
+
+
+def diff_indices(before, after):
+    """Split two sorted arrays of unique indices into (only in after, only in before).
+    A mask over the largest index is used instead of a sort, so it runs in linear time."""
+    if not len(before) or not len(after):
+        return np.asarray(after, dtype=np.uint32), np.asarray(before, dtype=np.uint32)
+    size = int(max(before[-1], after[-1])) + 1
+    in_before = np.zeros(size, dtype=bool)
+    in_before[before] = True
+    in_after = np.zeros(size, dtype=bool)
+    in_after[after] = True
+    return after[~in_before[after]], before[~in_after[before]]
+
+
+class MeshLintBitset:
+    """Flagged elements of one type as bits packed with np.packbits, as a streaming analysis builds them"""
+    __slots__ = ('bits', 'size', 'count')
+
+    def __init__(self, bits, size, count):
+        self.bits = bits
+        self.size = size
+        self.count = count
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+
+class MeshLintHistogram:
+    """Distribution of one value over the elements of a mesh, the valence of the verts or the size of the faces:
+    counts[k] elements have the value k. When open_ended the last bin also holds every greater value.
+    Checks flagging a range of that value (a 'threshold' in MeshLintAnalyzer.CHECKS) are queries on it."""
+    __slots__ = ('counts', 'values', 'open_ended')
+
+    def __init__(self, counts, values = None, open_ended = False):
+        self.counts = counts            # int64 count per value
+        self.values = values            # value per element, to list the elements of a range
+        self.open_ended = open_ended
+
+    @classmethod
+    def of(cls, values):
+        return cls(np.bincount(values), values)
+
+    @staticmethod
+    def merge(histograms):
+        """Sum of histograms of several meshes, without the values of their elements"""
+        histograms = list(histograms)
+        counts = np.zeros(max(len(histogram.counts) for histogram in histograms), dtype=np.int64)
+        for histogram in histograms:
+            counts[:len(histogram.counts)] += histogram.counts
+        return MeshLintHistogram(counts, open_ended = any(histogram.open_ended for histogram in histograms))
+
+    def summary(self):
+        """The same histogram without the values of the elements"""
+        return MeshLintHistogram(self.counts, open_ended = self.open_ended)
+
+    def count(self, low, high = None):
+        """Number of elements with low <= value <= high, without upper bound when high is None"""
+        stop = len(self.counts) if high is None else high + 1
+        return int(self.counts[low:stop].sum())
+
+    def indices(self, low, high = None):
+        """Indices of the elements with low <= value <= high"""
+        if high is None:
+            return np.flatnonzero(self.values >= low)
+        if low == high:
+            return np.flatnonzero(self.values == low)
+        return np.flatnonzero((self.values >= low) & (self.values <= high))
+
+    def bins(self):
+        """(value, count) of the bins holding elements, smallest value first"""
+        return [(value, count) for value, count in enumerate(self.counts.tolist()) if count]
+
+
+class MeshLintReport:
+    """Flagged indices of one check, stored per element type in a compact buffer.
+
+    Sparse results are kept as sorted uint32 arrays, handed out as read-only views. When more than one
+    element in 32 is flagged a bitset is smaller, so the result is packed with np.packbits instead.
+    A MeshLintBitset is kept as it is.
+    report['lint'] and report[elemtype] keep working like the dicts find_problems() used to return."""
+    __slots__ = ('lint', 'sizes', '_buffers', '_counts')
+
+    def __init__(self, lint, bad, sizes = None):
+        self.lint = lint
+        self.sizes = sizes
+        self._buffers = {}
+        self._counts = {}
+        for elemtype in ELEM_TYPES:
+            found = bad.get(elemtype, EMPTY_INDICES)
+            if isinstance(found, MeshLintBitset):
+                self._counts[elemtype] = found.count
+                if found.count:
+                    self._buffers[elemtype] = found.bits
+                continue
+            indices = np.asarray(found, dtype=np.uint32)
+            self._counts[elemtype] = len(indices)
+            size = sizes[elemtype] if sizes else None
+            if size and len(indices) * 32 > size:
+                mask = np.zeros(size, dtype=bool)
+                mask[indices] = True
+                self._buffers[elemtype] = np.packbits(mask)
+            elif len(indices):
+                indices.flags.writeable = False
+                self._buffers[elemtype] = indices
+
+    def is_bitset(self, elemtype):
+        return elemtype in self._buffers and self._buffers[elemtype].dtype == np.uint8
+
+    def count(self, elemtype = None):
+        """Number of flagged elements of one type, or of all of them"""
+        if elemtype is None:
+            return sum(self._counts.values())
+        return self._counts[elemtype]
+
+    def indices(self, elemtype):
+        """Sorted flagged indices, a view of the buffer unless it is a bitset"""
+        buffer = self._buffers.get(elemtype)
+        if buffer is None:
+            return EMPTY_INDICES
+        if buffer.dtype == np.uint8:
+            return np.flatnonzero(np.unpackbits(buffer, count=self.sizes[elemtype])).astype(np.uint32)
+        return buffer
+
+    def mask(self, elemtype, size = None):
+        """Boolean mask of the flagged elements, over size elements (the analyzed count by default)"""
+        if size is None:
+            size = self.sizes[elemtype]
+        buffer = self._buffers.get(elemtype)
+        if buffer is not None and buffer.dtype == np.uint8:
+            return np.unpackbits(buffer, count=size).view(bool)
+        mask = np.zeros(size, dtype=bool)
+        mask[self.indices(elemtype)] = True
+        return mask
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def __getitem__(self, key):
+        if key == 'lint':
+            return self.lint
+        return self.indices(key)
+
+    def as_dict(self):
+        """The report in the former dict shape: the lint plus a list of ints per element type"""
+        report = {'lint' : self.lint}
+        for elemtype in ELEM_TYPES:
+            report[elemtype] = self.indices(elemtype).tolist()
+        return report
+
+
+class MeshLintAnalysis:
+    """Result of one analysis: a MeshLintReport per enabled check, in CHECKS order.
+    Iterating or indexing it behaves like the former list of report dicts."""
+    __slots__ = ('reports', 'sizes')
+
+    def __init__(self, sizes = None, reports = None):
+        self.sizes = sizes
+        self.reports = [] if reports is None else reports
+
+    def __iter__(self):
+        return iter(self.reports)
+
+    def __len__(self):
+        return len(self.reports)
+
+    def __getitem__(self, position):
+        return self.reports[position]
+
+    def num_problems(self):
+        return sum(report.count() for report in self.reports)
+
+    @property
+    def nbytes(self):
+        return sum(report.nbytes for report in self.reports)
+
+    def diff(self, before):
+        """Compare with an earlier analysis, check by check and element by element.
+        Return two analyses: the newly flagged elements and the newly resolved ones."""
+        reports_before = {report.lint['symbol'] : report for report in before} if before is not None else {}
+        new = MeshLintAnalysis(self.sizes)
+        resolved = MeshLintAnalysis(before.sizes if before is not None else None)
+        for report in self.reports:
+            report_before = reports_before.get(report.lint['symbol'])
+            added = {}
+            removed = {}
+            for elemtype in ELEM_TYPES:
+                was = report_before.indices(elemtype) if report_before is not None else EMPTY_INDICES
+                added[elemtype], removed[elemtype] = diff_indices(was, report.indices(elemtype))
+            new.reports.append(MeshLintReport(report.lint, added, new.sizes))
+            resolved.reports.append(MeshLintReport(report.lint, removed, resolved.sizes))
+        return new, resolved
+
+    def as_dicts(self):
+        """The analysis in the former shape: a list of report dicts holding lists of ints"""
+        return [report.as_dict() for report in self.reports]
@@ -1,88 +1,324 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
 import bmesh
 import bpy
+import numpy as np
 
-from MeshLint.addons.MeshLint.meshLint.utilities import ensure_edit_mode, N_A_STR, ELEM_TYPES, TBD_STR
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintAnalysis, MeshLintReport
+from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import MeshLintArrays
+from MeshLint.addons.MeshLint.meshLint.MeshLintFusedScan import MeshLintFusedScan
+from MeshLint.addons.MeshLint.meshLint.MeshLintProfiler import MeshLintProfiler
+from MeshLint.addons.MeshLint.meshLint.MeshLintStream import MeshLintStream
+from MeshLint.addons.MeshLint.meshLint.MeshLintTopology import MeshLintTopology
+from MeshLint.addons.MeshLint.meshLint.utilities import ensure_edit_mode, exhaust, N_A_STR, ELEM_TYPES, TBD_STR, \
+    LINT_THREADS
 
 class MeshLintAnalyzer:
-    """The main branch of the application: Find the problems and define the checks"""
+    """The main branch of the application: Find the problems and define the checks.
+
+    CHECKS is the registry of the checks, read-only once the class is built. The counts of a run are
+    kept on the analyzer itself (counts, results()), so several analyzers can run side by side.
+    A check with a 'threshold' flags the elements of one type whose valence or size (its one fact) is in
+    a (lowest, highest) range, highest None for no bound: it is a query on topology_stats()."""
     CHECKS = []
+    # Each check also declares a 'cost', the rank it runs at in is_clean(): face sizes, then valences, then
+    # edge face counts, then the fans around the verts.
     obj : bpy.types.Object
     b : bmesh.types.BMesh
     num_problems_found : int | None
+    engine : str
 
-    def __init__(self, *args, obj = None, **kwargs):
+    def __init__(self, *args, obj = None, engine = None, edit_mode = True, depsgraph = None, **kwargs):
+        """With edit_mode=False an object outside of edit mode is analyzed straight from its mesh data,
+        or from its evaluated mesh when a depsgraph is given, without any mode switch"""
         super().__init__(*args, **kwargs)      #For blender 4.4 onwards
-        ensure_edit_mode()
+        if edit_mode:
+            ensure_edit_mode()
         if obj is None:
             self.obj = bpy.context.active_object
         else:
             self.obj = obj
-        self.b = bmesh.from_edit_mesh(self.obj.data)
+        self.owns_b = False
+        if self.obj.mode == 'EDIT':
+            self.mesh = self.obj.data
+            with MeshLintProfiler.stage('from_edit_mesh', self.num_elements):
+                self._b = bmesh.from_edit_mesh(self.obj.data)
+        elif depsgraph is not None:
+            self.mesh = self.obj.evaluated_get(depsgraph).data
+            self._b = None
+        else:
+            self.mesh = self.obj.data
+            self._b = None
         self.num_problems_found = None
+        self.counts = {}        # symbol -> count of the last run, N_A_STR for the disabled checks
+        if engine is None:
+            engine = getattr(bpy.context.scene, 'meshlint_engine', 'BMESH')
+        self.engine = engine
+        self.arrays = None
+        self.stream_histograms = None
+        self.synced = False
 
-    def find_problems(self):
-        """Find problems and count how many geometry elements need fixing"""
-        analysis = []
-        self.num_problems_found = 0
-        for lint in MeshLintAnalyzer.CHECKS:
+    @property
+    def b(self):
+        """The edit-mode BMesh, or outside of edit mode a copy of the mesh data made on first use"""
+        if self._b is None:
+            with MeshLintProfiler.stage('from_mesh', self.num_elements):
+                self._b = bmesh.new()
+                self._b.from_mesh(self.mesh)
+            self.owns_b = True
+        return self._b
+
+    def free(self):
+        """Release the BMesh copy made outside of edit mode"""
+        if self.owns_b:
+            self._b.free()
+            self._b = None
+            self.owns_b = False
+
+    def sync_mesh(self):
+        """In edit mode write the BMesh back to the mesh data before it is read, once per analyzer"""
+        if self.obj.mode == 'EDIT' and not self.synced:
+            self.obj.update_from_editmode()
+        self.synced = True
+
+    def topology_arrays(self):
+        """Bulk NumPy snapshot of the mesh topology, read once per analyzer"""
+        if self.arrays is None:
+            with MeshLintProfiler.stage('read_arrays', self.num_elements):
+                self.sync_mesh()
+                self.arrays = MeshLintArrays(self.mesh)
+        return self.arrays
+
+    def iter_fingerprint(self):
+        """Generator returning the topology fingerprint of the mesh, the one of topology_arrays().
+        The STREAM engine hashes the mesh chunk by chunk instead, yielding between chunks."""
+        if self.engine == 'STREAM' and self.arrays is None:
+            self.sync_mesh()
+            return (yield from MeshLintStream(self.mesh).iter_fingerprint())
+        return self.topology_arrays().fingerprint()
+
+    def run_checks(self, lints, elements = None):
+        """Run the given checks and return their flagged indices keyed by symbol.
+        The BMesh engine shares one fused pass over the mesh, the NumPy engine runs the array checks,
+        the adjacency ones on the shared topology index.
+        When elements is given only those BMesh elements are checked, always through the fused pass."""
+        return exhaust(self.iter_run_checks(lints, elements))
+
+    def array_checks(self, lints, elements = None):
+        """The checks answered from the topology arrays: all of them with the NumPy engine, none with the
+        other engines or when only some elements are checked"""
+        if elements is not None or self.engine != 'NUMPY':
+            return []
+        return list(lints)
+
+    def run_array_checks(self, lints):
+        """Run checks on the topology arrays and return their flagged indices keyed by symbol.
+        Once topology_arrays() has been read this only runs NumPy kernels, so it is safe on a worker thread."""
+        arrays = self.topology_arrays()
+        elements = arrays.num_verts + arrays.num_edges + arrays.num_faces
+        found = {}
+        for lint in lints:
+            with MeshLintProfiler.stage('check_' + f"{lint['symbol']}", elements):
+                found[lint['symbol']] = self.run_array_check(arrays, lint)
+        # The checks may have built relations, which count against the byte cap of the cached indices
+        MeshLintTopology.trim()
+        return found
+
+    @staticmethod
+    def run_array_check(arrays, lint):
+        """Flagged indices of one check on MeshLintArrays, a histogram query for the checks with a threshold"""
+        if 'threshold' in lint:
+            (elemtype, (low, high)), = lint['threshold'].items()
+            return arrays.threshold(elemtype, low, high)
+        return getattr(arrays, 'check_' + f"{lint['symbol']}")()
+
+    @staticmethod
+    def has_array_problems(arrays, lint):
+        """True when one check flags any element of MeshLintArrays"""
+        if 'threshold' in lint:
+            (elemtype, (low, high)), = lint['threshold'].items()
+            return arrays.has_threshold(elemtype, low, high)
+        return arrays.has_problems(lint['symbol'])
+
+    @staticmethod
+    def threshold_flag(lint):
+        """The flag of a check with a threshold for MeshLintFusedScan"""
+        (elemtype, (low, high)), = lint['threshold'].items()
+        (fact,) = lint['facts'][elemtype]
+        if high is None:
+            return lambda elemtype, facts: facts[fact] >= low
+        return lambda elemtype, facts: low <= facts[fact] <= high
+
+    @classmethod
+    def flag_of(cls, lint):
+        """The flag of a check for MeshLintFusedScan: its flag_ method, or one made from its threshold"""
+        if 'threshold' in lint:
+            return cls.threshold_flag(lint)
+        return getattr(cls, 'flag_' + f"{lint['symbol']}")
+
+    @staticmethod
+    def run_array_checks_all(jobs):
+        """run_array_checks() of several (analyzer, lints) jobs, side by side on up to LINT_THREADS worker
+        threads: the NumPy kernels release the GIL. Return the flagged indices of each job, in order."""
+        if len(jobs) < 2:
+            return [analyzer.run_array_checks(lints) for analyzer, lints in jobs]
+        with ThreadPoolExecutor(max_workers = min(LINT_THREADS, len(jobs))) as pool:
+            return list(pool.map(lambda job: job[0].run_array_checks(job[1]), jobs))
+
+    def iter_run_checks(self, lints, elements = None):
+        """Generator version of run_checks(), yielding between the array checks and slices of the fused pass"""
+        if self.engine == 'STREAM' and elements is None:
+            return (yield from self.iter_stream_checks(lints, histograms = self.wants_histograms()))
+        found = {}
+        for lint in self.array_checks(lints, elements):
+            found.update(self.run_array_checks([lint]))
+            yield
+        lints = [lint for lint in lints if lint['symbol'] not in found]
+        if not lints:
+            return found
+        checks = [(lint['symbol'], lint['facts'], self.flag_of(lint)) for lint in lints]
+        # The BMesh checks share one pass, so they are measured together
+        with MeshLintProfiler.stage('fused_scan', self.num_elements):
+            found.update((yield from MeshLintFusedScan(self.b, checks, elements = elements).iter_run()))
+        return found
+
+    def iter_stream_checks(self, lints, histograms = False):
+        """Run the checks on the mesh data read chunk by chunk (MeshLintStream), never holding it whole"""
+        self.sync_mesh()
+        stream = MeshLintStream(self.mesh)
+        found = yield from stream.iter_run(lints, histograms = histograms)
+        self.stream_histograms = stream.histograms
+        return found
+
+    def topology_stats(self):
+        """Histograms of the vert valences and of the face sizes, MeshLintHistogram keyed by element type, made
+        by one bincount each: the checks with a threshold are queries on them, and so would be any other
+        threshold. The STREAM engine gives those of its last run, the other engines those of the arrays."""
+        if self.engine == 'STREAM' and self.arrays is None:
+            if self.stream_histograms is None or len(self.stream_histograms) < 2:
+                exhaust(self.iter_stream_checks([], histograms = True))
+            return self.stream_histograms
+        return self.topology_arrays().histograms
+
+    @staticmethod
+    def wants_histograms():
+        """True when the side panel shows the histograms"""
+        return getattr(bpy.context.scene, 'meshlint_histograms', False)
+
+    def shown_histograms(self):
+        """topology_stats() for MeshLintStore when the side panel shows them, without the values of the
+        elements so that they outlive the analyzer cheaply, None otherwise"""
+        if not self.wants_histograms():
+            return None
+        return {elemtype : histogram.summary() for elemtype, histogram in self.topology_stats().items()}
+
+    def enabled_checks(self):
+        """Return the checks ticked in the scene, counting the other ones as N/A"""
+        enabled = []
+        for lint in self.CHECKS:
             should_check = getattr(bpy.context.scene, f"{lint['check_prop']}")
             if not should_check:
-                lint['count'] = N_A_STR
+                self.counts[lint['symbol']] = N_A_STR
                 continue
-            lint['count'] = 0
-            check_method_name = 'check_' + f"{lint['symbol']}"
-            check_method = getattr(type(self), check_method_name)
-            bad = check_method(self)
-            report = {'lint' : lint}
-            for elemtype in ELEM_TYPES :
-                indices = bad.get(elemtype, [])
-                report[elemtype] = indices
-                lint['count'] += len(indices)
-                self.num_problems_found += len(indices)
-            analysis.append(report)
+            enabled.append(lint)
+        return enabled
+
+    def find_problems(self):
+        """Find problems and count how many geometry elements need fixing"""
+        return exhaust(self.iter_find_problems())
+
+    def iter_find_problems(self):
+        """Generator version of find_problems(), yielding between slices of the checks"""
+        with MeshLintProfiler.stage('find_problems', self.num_elements):
+            enabled = self.enabled_checks()
+            found = yield from self.iter_run_checks(enabled)
+            return self.report_problems(enabled, found)
+
+    def report_problems(self, lints, found):
+        """Build the analysis from the flagged indices of each check and count the problems"""
+        sizes = self.element_counts()
+        analysis = MeshLintAnalysis(sizes)
+        self.num_problems_found = 0
+        for lint in lints:
+            report = MeshLintReport(lint, found[lint['symbol']], sizes)
+            self.counts[lint['symbol']] = report.count()
+            self.num_problems_found += self.counts[lint['symbol']]
+            analysis.reports.append(report)
         return analysis
 
+    def results(self):
+        """The checks with the counts of the last run of this analyzer, as new dicts (TBD_STR before any run)"""
+        return [dict(lint, count = self.counts.get(lint['symbol'], TBD_STR)) for lint in self.CHECKS]
+
+    def element_counts(self):
+        """Number of verts, edges and faces of the analyzed mesh"""
+        if self._b is not None:
+            return {'verts' : len(self._b.verts), 'edges' : len(self._b.edges), 'faces' : len(self._b.faces)}
+        return {'verts' : len(self.mesh.vertices), 'edges' : len(self.mesh.edges), 'faces' : len(self.mesh.polygons)}
+
+    def num_elements(self):
+        return sum(self.element_counts().values())
+
     def found_zero_problems(self):
         return self.num_problems_found == 0
 
+    def is_clean(self):
+        """Return True when none of the enabled checks flags anything, without counting nor selecting.
+        The checks run on the topology arrays, cheapest first, and the query stops at the first one
+        that flags an element."""
+        if self.engine == 'STREAM':
+            # Streamed checks share their passes, there is nothing to stop early
+            self.find_problems()
+            return self.found_zero_problems()
+        with MeshLintProfiler.stage('is_clean', self.num_elements):
+            arrays = self.topology_arrays()
+            for lint in sorted(self.enabled_checks(), key = lambda lint: lint['cost']):
+                if self.has_array_problems(arrays, lint):
+                    return False
+            return True
+
+    def check_one(self, symbol):
+        """Flagged indices of one check, as lists: on the topology arrays with the NumPy engine,
+        one pass over the BMesh with the others"""
+        lint = next(lint for lint in self.CHECKS if lint['symbol'] == symbol)
+        if self.engine == 'NUMPY':
+            found = self.run_array_check(self.topology_arrays(), lint)
+        else:
+            found = MeshLintFusedScan(self.b, [(symbol, lint['facts'], self.flag_of(lint))]).run()[symbol]
+        return {elemtype : np.asarray(indices).tolist() for elemtype, indices in found.items()}
+
     @classmethod
     def none_analysis(cls):
-        """Build an empty analysis list"""
-        analysis = []
-        for lint in cls.CHECKS:
-            row = {elemtype : [] for elemtype in ELEM_TYPES}
-            row['lint'] = lint
-            analysis.append(row)
-        return analysis
+        """Build an empty analysis"""
+        return MeshLintAnalysis(reports = [MeshLintReport(lint, {}) for lint in cls.CHECKS])
 
     CHECKS.append({
         'symbol' : 'tris',
         'label' : 'Tris',
         'definition' : 'A face with 3 edges. Often bad for modelling because it stops edge loops ' +
                        'and does not deform well around bent areas. A mesh might look good until you animate, so beware!',
-        'default' : True
+        'default' : True,
+        'facts' : {'faces' : ('size',)},
+        'cost' : 1,
+        'threshold' : {'faces' : (3, 3)}
     })
 
     def check_tris(self):
-        bad = {'faces' : []}
-        for fff in self.b.faces:
-            if len(fff.verts) == 3:
-                bad['faces'].append(fff.index)
-        return bad
+        return self.check_one('tris')
 
     CHECKS.append({
         'symbol' : 'ngons',
         'label' : 'Ngons',
         'definition' : 'A face with >4 edges. Is generally bad in exactly the same way as Tris',
-        'default' : True
+        'default' : True,
+        'facts' : {'faces' : ('size',)},
+        'cost' : 1,
+        'threshold' : {'faces' : (5, None)}
     })
 
     def check_ngons(self):
-        bad = {'faces' : []}
-        for fff in self.b.faces:
-            if len(fff.verts) > 4:
-                bad['faces'].append(fff.index)
-        return bad
+        return self.check_one('ngons')
 
     CHECKS.append({
         'symbol' : 'nonmanifold',
@@ -92,63 +328,65 @@ class MeshLintAnalyzer:
                        'that do not have exactly 2 faces attached to them (either more or less). ' +
                        'Non-manifold verts are more complicated -- you can see ' +
                        'their definition in BM_vert_is_manifold() in bmesh_queries.c',
-        'default' : True
+        'default' : True,
+        'facts' : {'verts' : ('manifold',), 'edges' : ('face_count',), 'faces' : ()},
+        'cost' : 4
     })
 
+    @staticmethod
+    def flag_nonmanifold(elemtype, facts):
+        if elemtype == 'verts':
+            return not facts['manifold']
+        return elemtype == 'edges' and facts['face_count'] != 2
+
     def check_nonmanifold(self):
-        bad = {'faces' : []}
-        for elemtype in 'verts', 'edges' :
-            bad[elemtype] = []
-            for elem in getattr(self.b, elemtype):
-                if not elem.is_manifold:
-                    bad[elemtype].append(elem.index)
-        # Exempt mirror-plane verts would go in here.
+        # Exempt mirror-plane verts would go in here, as the exempt_verts mask of the array check.
         # Plus: ...anybody wanna tackle Mirrors with an Object Offset?
-        return bad
+        return self.check_one('nonmanifold')
 
     CHECKS.append({
         'symbol' : 'interior_faces',
         'label' : 'Interior Faces',
         'definition' : 'This confuses people. It is very specific: A face whose edges ALL have >2 faces attached. ' +
                        'The simplest way to see this is to Ctrl+r a Default Cube and hit \'f\'',
-        'default' : True
+        'default' : True,
+        'facts' : {'faces' : ('min_edge_faces',)},
+        'cost' : 3
     })
 
+    @staticmethod
+    def flag_interior_faces(elemtype, facts):
+        return facts['min_edge_faces'] >= 3
+
     def check_interior_faces(self):
-        bad = {'faces' : []}
-        for fff in self.b.faces:
-            if not any(len(eee.link_faces) < 3 for eee in fff.edges):
-                bad['faces'].append(fff.index)
-        # geometry interior faces would not go in here.
-        return bad
+        # Every face looks at the face count of all its edges: the fused pass and the arrays count them once
+        return self.check_one('interior_faces')
 
     CHECKS.append({
         'symbol' : 'three_poles',
         'label' : '3-edge Poles',
         'definition' : 'A vertex with 3 edges connected to it. Also known as an N-Pole',
-        'default' : False
+        'default' : False,
+        'facts' : {'verts' : ('valence',)},
+        'cost' : 2,
+        'threshold' : {'verts' : (3, 3)}
     })
 
     def check_three_poles(self):
-        bad = {'verts' : []}
-        for vvv in self.b.verts:
-            if len(vvv.link_edges) == 3 :
-                bad['verts'].append(vvv.index)
-        return bad
+        return self.check_one('three_poles')
 
     CHECKS.append({
         'symbol' : 'five_poles',
         'label' : '5-edge Poles',
         'definition' : 'A vertex with 5 edges connected to it. Also known as an E-Pole',
-        'default' : False
+        'default' : False,
+        'facts' : {'verts' : ('valence',)},
+        'cost' : 2,
+        'threshold' : {'verts' : (5, 5)}
     })
 
     def check_five_poles(self):
-        bad = {'verts' : []}
-        for vvv in self.b.verts:
-            if len(vvv.link_edges) == 5 :
-                bad['verts'].append(vvv.index)
-        return bad
+        return self.check_one('five_poles')
 
     CHECKS.append({
         'symbol' : 'sixplus_poles',
@@ -159,15 +397,14 @@ class MeshLintAnalyzer:
                        '(imagine extruding each face of a Cube outward, ' +
                        'the inner corners are rightful 6+-poles). ' +
                        'Still, if you do not know for sure that you want them, i wart is good to enable this ',
-        'default' : False
+        'default' : False,
+        'facts' : {'verts' : ('valence',)},
+        'cost' : 2,
+        'threshold' : {'verts' : (6, None)}
     })
 
     def check_sixplus_poles(self):
-        bad = {'verts' : []}
-        for vvv in self.b.verts:
-            if len(vvv.link_edges) >= 6 :
-                bad['verts'].append(vvv.index)
-        return bad
+        return self.check_one('sixplus_poles')
 
     # ...any other great idea
 
@@ -176,40 +413,66 @@ class MeshLintAnalyzer:
         self.b.select_mode = {"VERT", "EDGE", 'FACE'}
 
     def select_indices(self, elemtype, indices):
-        """For a given element ('VERT', 'EDGE', 'FACE') then select that index """
-        for inc in indices:
-            match elemtype:
-                case 'verts':
-                    self.select_vert(inc)
-                case 'edges':
-                    self.select_edge(inc)
-                case 'faces':
-                    self.select_face(inc)
-                case _:
-                    print(f"MeshLint says: Huh?? → elemtype of {elemtype}.")
-
-    # The following select methods use both self.b and temporary bm, may cause wrong...
+        """For a given element type ('verts', 'edges', 'faces') select those indices.
+        Selecting a face (or an edge) through BMesh also selects its edges and verts."""
+        if elemtype not in ELEM_TYPES:
+            print(f"MeshLint says: Huh?? → elemtype of {elemtype}.")
+            return
+        elems = getattr(self.b, elemtype)
+        elems.ensure_lookup_table()
+        for index in indices:
+            elems[index].select = True
 
     def select_vert(self, index):
         """Select the given VERT index in the mesh"""
-        self.b.verts.ensure_lookup_table()
-        self.b.verts[index].select = True
+        self.select_indices('verts', (index,))
 
     def select_edge(self, index):
         """Select the given EDGE index in the mesh and its VERTS"""
-        self.b.edges.ensure_lookup_table()
-        edge = self.b.edges[index]
-        edge.select = True
-        for each in edge.verts:
-            self.select_vert(each.index)
+        self.select_indices('edges', (index,))
 
     def select_face(self, index):
         """Select the given FACE index in the mesh and its EDGES"""
-        self.b.faces.ensure_lookup_table()
-        face = self.b.faces[index]
-        face.select = True
-        for each in face.edges:
-            self.select_edge(each.index)
+        self.select_indices('faces', (index,))
+
+    @staticmethod
+    def flagged_indices(analysis):
+        """Merge the flagged indices of every check into one sorted array per element type"""
+        flagged = {}
+        for elemtype in ELEM_TYPES:
+            parts = [np.asarray(report[elemtype], dtype=np.int64) for report in analysis if len(report[elemtype])]
+            flagged[elemtype] = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+        return flagged
+
+    def select_analysis(self, analysis):
+        """Select exactly the flagged elements of the analysis, with the edges and verts of flagged faces
+        and edges, and deselect everything else. Outside of edit mode the selection is written to the
+        mesh data with one foreach_set per element type, in edit mode with one BMesh pass per type."""
+        flagged = self.flagged_indices(analysis)
+        with MeshLintProfiler.stage('select', self.num_elements):
+            if self.obj.mode == 'EDIT':
+                self.enable_anything_select_mode()
+                for elemtype in ELEM_TYPES:
+                    for elem in getattr(self.b, elemtype):
+                        elem.select = False
+                # Faces first: they select their edges and verts on the way
+                for elemtype in reversed(ELEM_TYPES):
+                    self.select_indices(elemtype, flagged[elemtype].tolist())
+                bmesh.update_edit_mesh(self.obj.data, loop_triangles=False, destructive=False)
+            else:
+                bpy.context.tool_settings.mesh_select_mode = (True, True, True)
+                masks = self.topology_arrays().selection_masks(flagged)
+                self.mesh.vertices.foreach_set("select", masks['verts'])
+                self.mesh.edges.foreach_set("select", masks['edges'])
+                self.mesh.polygons.foreach_set("select", masks['faces'])
+
+    @classmethod
+    def check_properties(cls):
+        """Keywords of the BoolProperty toggling each check on the scene, keyed by property name"""
+        return {
+            lint['check_prop'] : {'name' : lint['label'], 'default' : lint['default'], 'description' : lint['definition']}
+            for lint in cls.CHECKS
+        }
 
     def topology_counts(self):
         """Return object data and number of faces, edges & verts"""
@@ -221,20 +484,8 @@ class MeshLintAnalyzer:
         }
 
     for lint in CHECKS:
-        lint['count'] = TBD_STR
+        # The scene toggle of the check, added by the register() of the add-on (see check_properties())
         lint['check_prop'] = 'meshlint_check_' + f"{lint['symbol']}"
-        setattr(
-            bpy.types.Scene,
-            f"{lint['check_prop']}",
-            bpy.props.BoolProperty(
-                default=lint['default'],
-                description=lint['definition']
-            )
-        )
-        if hasattr(bpy.context, 'scene'):
-            # At first startup then context does not have a scene attribute
-            if hasattr(bpy.context.scene, f"{lint['check_prop']}"):
-                # When reloading the check_prop attribute, it might not have been created
-                # If it has, then proceed with defaulting the toggles settings.
-                setattr(bpy.context.scene, f"{lint['check_prop']}", lint['default'])
 
+    # The registry is shared by every analyzer: results go in the analyzers, never in these dicts
+    CHECKS = tuple(MappingProxyType(lint) for lint in CHECKS)
@@ -0,0 +1,196 @@
+import hashlib
+
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintHistogram
+from MeshLint.addons.MeshLint.meshLint.MeshLintTopology import MeshLintTopology
+
+
+def interior_faces(loop_edges, loop_starts, edge_face_counts):
+    """Indices of the faces whose edges all have 3 or more faces attached.
+    The smallest edge face count of each face is found by one reduceat over its corners."""
+    if len(loop_starts) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.minimum.reduceat(edge_face_counts[loop_edges], loop_starts) >= 3)
+
+
+def count_fans(loop_verts, edge_loops, loop_next, edge_face_counts, num_verts):
+    """Number of face fans around each vert.
+
+    The corners of a vert are the face loops starting at it. Two of them belong to the same fan when
+    they share an edge used by exactly two faces, as BM_vert_step_fan_loop() steps across. Corners are
+    grouped per edge with the CSR edge→loop index, then the fans are the connected components of that
+    relation, labelled by their smallest corner through min-label hooking and pointer jumping."""
+    num_loops = len(loop_verts)
+    shared = edge_loops.offsets[:-1][edge_face_counts == 2]
+    first = edge_loops.indices[shared]
+    second = edge_loops.indices[shared + 1]
+    # Where the two faces run along the edge the same way, their corners at each end are the matching loops
+    same_way = loop_verts[first] == loop_verts[second]
+    a = np.concatenate((first, loop_next[first]))
+    b = np.concatenate((np.where(same_way, second, loop_next[second]), np.where(same_way, loop_next[second], second)))
+
+    roots = connected_labels(num_loops, a, b) == np.arange(num_loops)
+    return np.bincount(loop_verts[roots], minlength=num_verts)
+
+
+def connected_labels(num_nodes, a, b):
+    """Label of the connected component of each node, its smallest node, for the links a[i]-b[i]"""
+    labels = np.arange(num_nodes)
+    while True:
+        lowest = np.minimum(labels[a], labels[b])
+        hooked = labels.copy()
+        np.minimum.at(hooked, a, lowest)
+        np.minimum.at(hooked, b, lowest)
+        hooked = hooked[hooked]
+        if np.array_equal(hooked, labels):
+            break
+        labels = hooked
+    return labels
+
+
+def nonmanifold_verts(valences, edge_verts, edge_face_counts, fans, exempt_verts = None):
+    """Indices of the verts BM_vert_is_manifold() rejects: verts without any edge, verts with a wire edge
+    or an edge of more than two faces, verts with three boundary edges or more, and verts whose faces
+    do not form exactly one fan. exempt_verts is an optional boolean mask of verts never flagged,
+    such as the verts lying on a mirror plane."""
+    num_verts = len(valences)
+    broken = (edge_face_counts == 0) | (edge_face_counts > 2)
+    rejected = valences == 0
+    rejected |= np.bincount(edge_verts[broken].ravel(), minlength=num_verts) > 0
+    rejected |= np.bincount(edge_verts[edge_face_counts == 1].ravel(), minlength=num_verts) >= 3
+    rejected |= fans != 1
+    if exempt_verts is not None:
+        rejected &= ~exempt_verts
+    return np.flatnonzero(rejected)
+
+
+class MeshLintArrays:
+    """Bulk NumPy snapshot of a mesh topology, with the checks written as array operations.
+    Every check_* method mirrors the one of MeshLintAnalyzer and returns index arrays instead of lists.
+    The checks with a 'threshold' are answered by threshold() from the valence and face-size histograms."""
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.num_verts = len(mesh.vertices)
+        self.num_edges = len(mesh.edges)
+        self.num_faces = len(mesh.polygons)
+        self.num_loops = len(mesh.loops)
+
+        self.edge_verts = np.empty(self.num_edges * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", self.edge_verts)
+        self.edge_verts.shape = (self.num_edges, 2)
+
+        self.face_sizes = np.empty(self.num_faces, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", self.face_sizes)
+        self.loop_starts = np.empty(self.num_faces, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", self.loop_starts)
+
+        self.loop_verts = np.empty(self.num_loops, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", self.loop_verts)
+        self.loop_edges = np.empty(self.num_loops, dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", self.loop_edges)
+
+        self._fingerprint = None
+        self._topology = None
+        self._histograms = {}
+
+    @staticmethod
+    def estimate_nbytes(mesh):
+        """Rough bytes of the snapshot of mesh and of the topology relations its checks build, from its
+        element counts alone"""
+        return 48 * len(mesh.loops) + 32 * len(mesh.edges) + 16 * (len(mesh.vertices) + len(mesh.polygons))
+
+    # ---------------- derived arrays ----------------
+    @property
+    def topology(self):
+        """Adjacency index shared by every snapshot with the same fingerprint"""
+        if self._topology is None:
+            self._topology = MeshLintTopology.of(self)
+        return self._topology
+
+    @property
+    def valences(self):
+        """Number of edges attached to each vertex"""
+        return self.topology.valences
+
+    @property
+    def edge_face_counts(self):
+        """Number of faces attached to each edge"""
+        return self.topology.edge_face_counts
+
+    def histogram(self, elemtype):
+        """MeshLintHistogram of the vert valences or of the face sizes, a bincount each made once"""
+        if elemtype not in self._histograms:
+            self._histograms[elemtype] = MeshLintHistogram.of(self.valences if elemtype == 'verts' else self.face_sizes)
+        return self._histograms[elemtype]
+
+    @property
+    def histograms(self):
+        return {elemtype : self.histogram(elemtype) for elemtype in ('verts', 'faces')}
+
+    def fingerprint(self):
+        """Hash of the topology only: face-size histogram, edge vertex pairs and face loops.
+        Moving verts keeps it, any change of connectivity (even with equal counts) changes it."""
+        if self._fingerprint is None:
+            self._fingerprint = self.compute_fingerprint()
+        return self._fingerprint
+
+    def compute_fingerprint(self):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array((self.num_verts, self.num_edges, self.num_faces, self.num_loops), dtype=np.int64).tobytes())
+        digest.update(self.histogram('faces').counts.astype(np.int64).tobytes())
+        digest.update(self.edge_verts.tobytes())
+        digest.update(self.loop_starts.tobytes())
+        digest.update(self.loop_verts.tobytes())
+        digest.update(self.loop_edges.tobytes())
+        return digest.hexdigest()
+
+    def selection_masks(self, flagged):
+        """Boolean select masks per element type for the flagged indices (element type -> index array).
+        Flagged faces spread to their edges, then flagged edges to their verts, as BMesh selection does."""
+        faces = np.zeros(self.num_faces, dtype=bool)
+        faces[flagged.get('faces', [])] = True
+        edges = np.zeros(self.num_edges, dtype=bool)
+        edges[flagged.get('edges', [])] = True
+        edges[self.loop_edges[np.repeat(faces, self.face_sizes)]] = True
+        verts = np.zeros(self.num_verts, dtype=bool)
+        verts[flagged.get('verts', [])] = True
+        verts[self.edge_verts[edges].ravel()] = True
+        return {'verts' : verts, 'edges' : edges, 'faces' : faces}
+
+    # ---------------- checks ----------------
+    def has_problems(self, symbol):
+        """True when the check flags any element, through its has_ shortcut when it has one"""
+        shortcut = getattr(self, 'has_' + symbol, None)
+        if shortcut is not None:
+            return shortcut()
+        return any(len(indices) for indices in getattr(self, 'check_' + symbol)().values())
+
+    def threshold(self, elemtype, low, high = None):
+        """Flagged indices of a check with a threshold: the elements whose value is in low..high"""
+        return {elemtype : self.histogram(elemtype).indices(low, high)}
+
+    def has_threshold(self, elemtype, low, high = None):
+        return self.histogram(elemtype).count(low, high) > 0
+
+    def check_nonmanifold(self, exempt_verts = None):
+        """exempt_verts is a boolean mask of verts to leave out, with the boundary edges joining two of them"""
+        bad = {'faces' : np.empty(0, dtype=np.int64)}
+        topology = self.topology
+        fans = count_fans(self.loop_verts, topology.edge_loops, topology.loop_next, self.edge_face_counts, self.num_verts)
+        bad['verts'] = nonmanifold_verts(self.valences, self.edge_verts, self.edge_face_counts, fans, exempt_verts)
+        rejected = self.edge_face_counts != 2
+        if exempt_verts is not None:
+            rejected &= ~((self.edge_face_counts == 1) & exempt_verts[self.edge_verts].all(axis=1))
+        bad['edges'] = np.flatnonzero(rejected)
+        return bad
+
+    def has_nonmanifold(self):
+        # Most meshes with lint have a boundary or a wire edge, which answers before any fan is counted
+        if (self.edge_face_counts != 2).any():
+            return True
+        return len(self.check_nonmanifold()['verts']) > 0
+
+    def check_interior_faces(self):
+        return {'faces' : interior_faces(self.loop_edges, self.loop_starts, self.edge_face_counts)}
@@ -0,0 +1,192 @@
+import argparse
+import gc
+from contextlib import nullcontext
+import json
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintReport
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import MeshLintArrays
+from MeshLint.addons.MeshLint.meshLint.MeshLintBatchPool import MeshLintBatchPool, WORKER_PREFIX
+from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
+from MeshLint.addons.MeshLint.meshLint.MeshLintStream import MeshLintStream
+from MeshLint.addons.MeshLint.meshLint.utilities import exhaust, N_A_STR
+
+
+class MeshLintBatch:
+    """Lint every mesh of a list of .blend files without any UI, mode switch or active object.
+
+    Records are written as JSON lines, one per mesh object then one summary per file (or file shard),
+    and flushed as soon as they are known so a whole library is streamed with a flat memory footprint.
+    Object records are summed into MeshLintStore, whose totals end the report."""
+
+    def __init__(self, stream, symbols = None, evaluated = False, indices = False, prefix = '', chunked = False):
+        if symbols is None:
+            symbols = [lint['symbol'] for lint in MeshLintAnalyzer.CHECKS if lint['default']]
+        self.lints = [lint for lint in MeshLintAnalyzer.CHECKS if lint['symbol'] in symbols]
+        self.stream = stream
+        self.evaluated = evaluated
+        self.indices = indices
+        self.prefix = prefix
+        self.chunked = chunked
+        self.problems_found = 0
+        self.store = MeshLintStore()
+        self.store.clear()
+
+    @staticmethod
+    def iter_blend_files(paths):
+        """Expand directories into the .blend files they contain, keeping the given order"""
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                yield from sorted(path.rglob('*.blend'))
+            else:
+                yield path
+
+    def lint_mesh(self, mesh):
+        """Run the enabled checks on a mesh datablock and return its record fields.
+        With chunked, the mesh is read a chunk at a time (MeshLintStream) instead of whole."""
+        if self.chunked:
+            found = exhaust(MeshLintStream(mesh).iter_run(self.lints))
+        else:
+            arrays = MeshLintArrays(mesh)
+            found = {lint['symbol'] : MeshLintAnalyzer.run_array_check(arrays, lint) for lint in self.lints}
+        sizes = {'verts' : len(mesh.vertices), 'edges' : len(mesh.edges), 'faces' : len(mesh.polygons)}
+        counts = {}
+        flagged = {}
+        for lint in self.lints:
+            bad = found[lint['symbol']]
+            report = MeshLintReport(lint, bad, sizes)
+            counts[lint['symbol']] = report.count()
+            if self.indices:
+                flagged[lint['symbol']] = {elemtype : report.indices(elemtype).tolist() for elemtype in bad}
+        record = {'counts' : counts, 'problems' : sum(counts.values())}
+        if self.indices:
+            record['indices'] = flagged
+        return record
+
+    def iter_object_records(self, shard = 0, shards = 1):
+        """Lint the mesh objects of the open file that belong to the given shard"""
+        depsgraph = bpy.context.evaluated_depsgraph_get() if self.evaluated else None
+        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+        for obj in meshes[shard::shards]:
+            if depsgraph is None:
+                record = self.lint_mesh(obj.data)
+            else:
+                evaluated = obj.evaluated_get(depsgraph)
+                try:
+                    record = self.lint_mesh(evaluated.to_mesh())
+                finally:
+                    evaluated.to_mesh_clear()
+            record['object'] = obj.name
+            record['mesh'] = obj.data.name
+            yield record
+
+    def lint_file(self, path, shard = 0, shards = 1):
+        """Open one .blend file, emit a record per mesh object of the shard and a summary"""
+        started = time.perf_counter()
+        summary = {'file' : str(path), 'objects' : 0, 'problems' : 0}
+        if shards > 1:
+            summary['shard'] = f"{shard + 1}/{shards}"
+        try:
+            bpy.ops.wm.open_mainfile(filepath=str(path), load_ui=False)
+            for record in self.iter_object_records(shard, shards):
+                record['file'] = str(path)
+                self.emit(record)
+                summary['objects'] += 1
+                summary['problems'] += record['problems']
+        except Exception as error:  # One broken file must not stop the whole library
+            summary['error'] = f"{type(error).__name__}: {error}"
+        summary['seconds'] = round(time.perf_counter() - started, 4)
+        summary['summary'] = True
+        self.emit(summary)
+        gc.collect()
+
+    def emit(self, record):
+        """Write one record and add it to the totals. Only the object records count: a file whose worker died
+        partway still has the records of the objects it got through."""
+        self.stream.write(self.prefix + json.dumps(record) + '\n')
+        self.stream.flush()
+        if 'counts' in record:
+            checks = [dict(lint, count = record['counts'].get(lint['symbol'], N_A_STR)) for lint in MeshLintAnalyzer.CHECKS]
+            self.store.add_counts(checks)
+            self.problems_found += record['problems']
+
+    def totals(self):
+        """Problem counts of every check summed over all the objects seen so far"""
+        return {lint['symbol'] : lint['count'] for lint in self.store.results}
+
+    def finish(self):
+        """End the report with the totals and return the number of problems found"""
+        self.emit({'totals' : self.totals(), 'problems' : self.problems_found})
+        return self.problems_found
+
+    def run(self, paths):
+        """Lint every file of paths one after the other, return the number of problems found"""
+        for path in self.iter_blend_files(paths):
+            self.lint_file(path)
+        return self.finish()
+
+    def serve(self, requests):
+        """Worker loop: lint the work items read from requests, a JSON object per line,
+        and mark the end of each one so the coordinator can send the next"""
+        for line in requests:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            self.lint_file(item['file'], item['shard'], item['shards'])
+            self.emit({'done' : True})
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='blender -b --python meshlint_batch.py --',
+        description='Lint the meshes of .blend files and write a JSON lines report.')
+    parser.add_argument('paths', nargs='*', help='.blend files or directories searched recursively')
+    parser.add_argument('-o', '--output', help='report file, standard output when omitted')
+    parser.add_argument('--checks', help='comma separated check symbols, the checks enabled by default when omitted')
+    parser.add_argument('--evaluated', action='store_true', help='lint the meshes with their modifiers applied')
+    parser.add_argument('--indices', action='store_true', help='also report the flagged element indices')
+    parser.add_argument('--chunked', action='store_true', help='read each mesh in fixed-size chunks, for meshes '
+                                                               'too large to be read whole')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes linting in parallel')
+    parser.add_argument('--shards', type=int, help='split each file into this many object shards, '
+                                                  'by default enough to keep every worker busy')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if not args.worker and not args.paths:
+        parser.error('give at least one .blend file or directory')
+    if args.checks:
+        known = [lint['symbol'] for lint in MeshLintAnalyzer.CHECKS]
+        unknown = [symbol for symbol in args.checks.split(',') if symbol not in known]
+        if unknown:
+            parser.error(f"unknown checks {', '.join(unknown)}, choose from {', '.join(known)}")
+    return args
+
+
+def main(argv = None):
+    """Entry point of the batch linter, returns 1 when any problem was found so pipelines can fail on it"""
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = parse_args(argv)
+    symbols = args.checks.split(',') if args.checks else None
+    if args.worker:
+        batch = MeshLintBatch(sys.stdout, symbols, args.evaluated, args.indices, prefix = WORKER_PREFIX,
+                              chunked = args.chunked)
+        batch.serve(sys.stdin)
+        return 0
+    with open(args.output, 'w', encoding='utf-8') if args.output else nullcontext(sys.stdout) as stream:
+        batch = MeshLintBatch(stream, symbols, args.evaluated, args.indices, chunked = args.chunked)
+        if args.jobs > 1:
+            worker_args = ['--checks', args.checks] if args.checks else []
+            worker_args += ['--evaluated'] * args.evaluated + ['--indices'] * args.indices + ['--chunked'] * args.chunked
+            pool = MeshLintBatchPool(args.jobs, worker_args, shards = args.shards)
+            pool.run(list(batch.iter_blend_files(args.paths)), batch.emit)
+            problems = batch.finish()
+        else:
+            problems = batch.run(args.paths)
+    return 1 if problems else 0
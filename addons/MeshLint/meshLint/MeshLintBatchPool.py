@@ -0,0 +1,127 @@
+import json
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import bpy
+
+# Workers prefix their records with this, Blender prints its own messages on the same stdout
+WORKER_PREFIX = 'MESHLINT:'
+BATCH_SCRIPT = Path(__file__).resolve().parents[3] / 'scripts' / 'meshlint_batch.py'
+
+
+class MeshLintBatchPool:
+    """Spread batch linting over a pool of worker processes, each one a background Blender
+    (or a Python with the bpy module) running the batch script in worker mode.
+
+    Work items are (file, shard) pairs in a shared queue. One coordinator thread per worker hands it
+    the next item as soon as it reports the previous one done, so slow files never hold back the
+    others, and streams the worker records back to the main thread for writing and aggregation."""
+
+    def __init__(self, jobs, worker_args = (), shards = None):
+        self.jobs = jobs
+        self.worker_args = list(worker_args)
+        self.shards = shards
+
+    def worker_command(self):
+        """Command line starting one worker, Blender when running inside it, Python for the bpy module"""
+        if bpy.app.binary_path:
+            command = [bpy.app.binary_path, '-b', '--factory-startup', '--python', str(BATCH_SCRIPT), '--']
+        else:
+            command = [sys.executable, str(BATCH_SCRIPT), '--']
+        return command + ['--worker'] + self.worker_args
+
+    def work_items(self, files):
+        """Split the files in object shards, enough of them to give every worker something to do"""
+        shards = self.shards or max(1, self.jobs // max(1, len(files)))
+        return [{'file' : str(path), 'shard' : shard, 'shards' : shards} for path in files for shard in range(shards)]
+
+    def run(self, files, emit):
+        """Lint the files with the worker pool, calling emit with every record from the calling thread"""
+        items = queue.Queue()
+        for item in self.work_items(files):
+            items.put(item)
+        results = queue.Queue()
+        threads = [threading.Thread(target=self.serve, args=(items, results), daemon=True)
+                   for _ in range(min(self.jobs, items.qsize()))]
+        for thread in threads:
+            thread.start()
+        running = len(threads)
+        while running:
+            record = results.get()
+            if record is None:
+                running -= 1
+                continue
+            emit(record)
+        for thread in threads:
+            thread.join()
+
+    def serve(self, items, results):
+        """Coordinator thread of one worker: feed it items until the queue is empty"""
+        process = None
+        try:
+            while True:
+                try:
+                    item = items.get_nowait()
+                except queue.Empty:
+                    break
+                summary = self.summary(item)
+                try:
+                    if process is None:
+                        process = subprocess.Popen(self.worker_command(), stdin=subprocess.PIPE,
+                                                   stdout=subprocess.PIPE, text=True, bufsize=1)
+                    process.stdin.write(json.dumps(item) + '\n')
+                    process.stdin.flush()
+                    served = self.relay(process, results, summary)
+                except Exception as error:  # The worker could not be started or fed: report the item
+                    results.put(self.failed(summary, f"{type(error).__name__}: {error}"))
+                    if process is not None:
+                        process.kill()
+                        process.wait()
+                    process = None
+                    continue
+                if not served:
+                    # The worker died on this item: report it and start a fresh one for the next
+                    results.put(self.failed(summary, f"worker exited with code {process.wait()}"))
+                    process = None
+        finally:
+            if process is not None:
+                process.stdin.close()
+                process.wait()
+            results.put(None)
+
+    @staticmethod
+    def summary(item):
+        """The summary record of an item before any of its objects came back"""
+        summary = {'file' : item['file'], 'objects' : 0, 'problems' : 0}
+        if item['shards'] > 1:
+            summary['shard'] = f"{item['shard'] + 1}/{item['shards']}"
+        return summary
+
+    @staticmethod
+    def failed(summary, error):
+        """The summary record of an item no worker could finish, as MeshLintBatch.lint_file() writes for a broken
+        file: it counts the object records already relayed, so the file totals match them"""
+        summary['error'] = error
+        summary['summary'] = True
+        return summary
+
+    @staticmethod
+    def relay(process, results, summary):
+        """Pass the worker records on until it reports the item done, return False if it died first.
+        The object records are counted into summary."""
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                return False
+            if not line.startswith(WORKER_PREFIX):
+                continue
+            record = json.loads(line[len(WORKER_PREFIX):])
+            if record.get('done'):
+                return True
+            if 'counts' in record:
+                summary['objects'] += 1
+                summary['problems'] += record['problems']
+            results.put(record)
@@ -0,0 +1,167 @@
+import sys
+from collections import OrderedDict
+
+import bpy
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintProfiler import MeshLintProfiler
+from MeshLint.addons.MeshLint.meshLint.utilities import CACHE_MAX_BYTES
+
+
+@bpy.app.handlers.persistent
+def meshlint_gbl_cache_invalidate(scene, depsgraph):
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object):
+            if not update.is_updated_geometry or datablock.type != 'MESH':
+                continue
+            datablock = datablock.data
+        if isinstance(datablock, bpy.types.Mesh):
+            MeshLintCache().forget(datablock.session_uid)
+
+
+@bpy.app.handlers.persistent
+def meshlint_gbl_cache_clear(*args):
+    """Another file was loaded: none of the cached meshes is around any more"""
+    MeshLintCache().clear()
+    # The topology index is only there once something was checked, without importing NumPy otherwise
+    topology = sys.modules.get('MeshLint.addons.MeshLint.meshLint.MeshLintTopology')
+    if topology is not None:
+        topology.MeshLintTopology.clear()
+
+
+class MeshLintCache:
+    """
+    Least recently used cache of lint results, so meshes shared by many objects, or analyzed again
+    without any edit, are only checked once.
+
+    An entry belongs to a mesh datablock (session_uid) and a set of enabled checks, and is only served
+    while the topology fingerprint it was computed with still matches. Fingerprints of meshes outside
+    of edit mode are remembered until a depsgraph update touches their geometry; edit meshes are always
+    fingerprinted again. Flagged indices are kept as uint32 arrays, which the MeshLintReport buffers
+    share, and the oldest entries are evicted once they take more than CACHE_MAX_BYTES.
+    Analyses of the STREAM engine are never cached: fingerprinting them would read the whole mesh.
+    This module is imported at registration for its depsgraph handler, so NumPy and MeshLintAnalyzer
+    are only imported by the methods needing them.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.entries = OrderedDict()
+            cls._instance.fingerprints = {}
+            cls._instance.nbytes = 0
+            cls._instance.hits = 0
+            cls._instance.misses = 0
+        return cls._instance
+
+    def clear(self):
+        self.entries.clear()
+        self.fingerprints.clear()
+        self.nbytes = 0
+
+    def forget(self, session_uid):
+        """The geometry of that mesh may have changed, its fingerprint has to be computed again"""
+        self.fingerprints.pop(session_uid, None)
+
+    def fingerprint(self, analyzer):
+        session_uid = analyzer.mesh.session_uid
+        if analyzer.obj.mode == 'EDIT' or session_uid not in self.fingerprints:
+            self.fingerprints[session_uid] = analyzer.topology_arrays().fingerprint()
+        return self.fingerprints[session_uid]
+
+    def lookup(self, analyzer):
+        """Enabled checks, key and fingerprint of the analyzer mesh, with its cached flagged indices or None"""
+        lints = analyzer.enabled_checks()
+        key = (analyzer.mesh.session_uid, tuple(lint['symbol'] for lint in lints))
+        fingerprint = self.fingerprint(analyzer)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return lints, key, fingerprint, entry[1]
+        return lints, key, fingerprint, None
+
+    def find_problems(self, analyzer):
+        """Same as analyzer.find_problems(), served from the cache when possible"""
+        return self.find_problems_all([analyzer])[0]
+
+    def iter_find_problems(self, analyzer):
+        """Generator version of find_problems(), yielding between slices of the checks of a cache miss"""
+        if analyzer.engine == 'STREAM':
+            return (yield from analyzer.iter_find_problems())
+        with MeshLintProfiler.stage('find_problems', analyzer.num_elements):
+            lints, key, fingerprint, found = self.lookup(analyzer)
+            if found is None:
+                self.misses += 1
+                found = self.keep(key, fingerprint, (yield from analyzer.iter_run_checks(lints)))
+            return analyzer.report_problems(lints, found)
+
+    def find_problems_all(self, analyzers):
+        """find_problems() of several analyzers, served from the cache when possible. The meshes are read
+        and the BMesh checks run on this thread, while the array checks of the meshes missing from the
+        cache run side by side on worker threads (MeshLintAnalyzer.run_array_checks_all). The BMesh copy of
+        an object outside of edit mode is freed as soon as its checks are done."""
+        with MeshLintProfiler.stage('find_problems', lambda: sum(analyzer.num_elements() for analyzer in analyzers)):
+            lookups = [None if analyzer.engine == 'STREAM' else self.lookup(analyzer) for analyzer in analyzers]
+            misses = {}         # key -> position of the first analyzer of that mesh missing from the cache
+            for position, lookup in enumerate(lookups):
+                if lookup is None:
+                    continue
+                lints, key, fingerprint, found = lookup
+                if found is None and key not in misses:
+                    misses[key] = position
+                    analyzers[position].topology_arrays()   # bpy is only read from this thread
+                elif found is None:
+                    self.hits += 1      # Same mesh as an earlier analyzer of the batch
+            jobs = [(analyzers[position], analyzers[position].array_checks(lookups[position][0]))
+                    for position in misses.values()]
+            computed = {}
+            from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+            for (key, position), found in zip(misses.items(), MeshLintAnalyzer.run_array_checks_all(jobs)):
+                self.misses += 1
+                analyzer, lints = analyzers[position], lookups[position][0]
+                found.update(analyzer.run_checks([lint for lint in lints if lint['symbol'] not in found]))
+                analyzer.free()
+                computed[key] = self.keep(key, lookups[position][2], found)
+            analyses = []
+            for analyzer, lookup in zip(analyzers, lookups):
+                if lookup is None:
+                    analyses.append(analyzer.find_problems())
+                    continue
+                lints, key, fingerprint, found = lookup
+                if found is None:
+                    found = computed[key]
+                analyses.append(analyzer.report_problems(lints, found))
+            return analyses
+
+    def keep(self, key, fingerprint, found):
+        """Put freshly computed flagged indices into the cache as uint32 arrays and return those"""
+        import numpy as np
+        found = {symbol : {elemtype : np.asarray(indices, dtype=np.uint32) for elemtype, indices in bad.items()}
+                 for symbol, bad in found.items()}
+        self.put(key, fingerprint, found)
+        return found
+
+    def put(self, key, fingerprint, found):
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[2]
+        nbytes = sum(indices.nbytes for bad in found.values() for indices in bad.values())
+        self.entries[key] = (fingerprint, found, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > CACHE_MAX_BYTES and len(self.entries) > 1:
+            _, (_, _, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(meshlint_gbl_cache_invalidate)
+    bpy.app.handlers.load_post.append(meshlint_gbl_cache_clear)
+
+
+def unregister():
+    if meshlint_gbl_cache_invalidate in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(meshlint_gbl_cache_invalidate)
+    if meshlint_gbl_cache_clear in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(meshlint_gbl_cache_clear)
+    MeshLintCache().clear()
@@ -1,107 +1,127 @@
 from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
-from MeshLint.addons.MeshLint.meshLint.utilities import is_edit_mode, depluralize, COMPLAINT_TIMEOUT
+from MeshLint.addons.MeshLint.meshLint.MeshLintIncremental import MeshLintIncremental
+from MeshLint.addons.MeshLint.meshLint.MeshLintScheduler import MeshLintScheduler
+from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
+from MeshLint.addons.MeshLint.meshLint.utilities import is_edit_mode, depluralize, exhaust, COMPLAINT_TIMEOUT, ELEM_TYPES, \
+    MAX_LISTED_INDICES
 import time
 import bpy
 
 @bpy.app.handlers.persistent
 def meshlint_gbl_continuous_check(scene, depsgraph):
-    MeshLintContinuousChecker.check()
+    MeshLintScheduler.request(MeshLintContinuousChecker)
 
 class MeshLintContinuousChecker:
     current_message = ''
     time_complained = 0
-    # previous_topology_counts = None
+    previous_fingerprint = None
+    fingerprint_seconds = None  # Cost of telling whether the topology changed, on the last check
     previous_analysis = None
     previous_data_name = None
+    new_problems = None         # Elements flagged by the last analysis but not by the one before
+    resolved_problems = None    # Elements flagged before the last analysis but not any more
+    incremental = MeshLintIncremental()
 
     @classmethod
     def check(cls):
+        exhaust(cls.iter_check())
+
+    @classmethod
+    def iter_check(cls):
+        """Generator version of check(), yielding between slices of the analysis.
+        Every tick fingerprints the whole topology: equal element counts say nothing of an edge rotation."""
         if not is_edit_mode():
             return
         analyzer = MeshLintAnalyzer()
-        now_counts = analyzer.topology_counts()
-        if hasattr(cls, 'previous_topology_counts'):
-            previous_topology_counts = cls.previous_topology_counts
-            if previous_topology_counts is not None:
-                 try:
-                     if 'data' not in previous_topology_counts:
-                         print('no "data" in previous topology counts')
-                     if not hasattr(previous_topology_counts['data'], 'name'):
-                         print('no "name" attribute')
-                 except ReferenceError:
-                     print('Must be "data" that did not exist')
-                     print(previous_topology_counts)
-        else:
-            previous_topology_counts = None
+        started = time.perf_counter()
+        # The STREAM engine hashes the mesh chunk by chunk, never reading it whole
+        fingerprint = (
+            analyzer.obj.data.as_pointer(),
+            tuple(lint['symbol'] for lint in MeshLintAnalyzer.CHECKS if getattr(bpy.context.scene, lint['check_prop'])),
+            (yield from analyzer.iter_fingerprint()),
+        )
+        cls.fingerprint_seconds = time.perf_counter() - started
+        if fingerprint != cls.previous_fingerprint:
+            # The incremental buckets are sets of indices, streamed results stay bitsets
+            if getattr(bpy.context.scene, 'meshlint_incremental', False) and analyzer.engine != 'STREAM':
+                analysis = yield from cls.incremental.iter_update(analyzer)
+            else:
+                cls.incremental.clear()
+                analysis = yield from analyzer.iter_find_problems()
+            cls.publish(analysis)
+            # Only this object is re-linted, the totals of the other ones stay in the store
+            MeshLintStore().add_counts(analyzer.results(), key = analyzer.obj.name, histograms = analyzer.shown_histograms())
+            cls.previous_fingerprint = fingerprint
+        cls.expire_complaint()
 
-        # analyzer.find_problems() # putting this here makes it run more often
-        if previous_topology_counts is None or now_counts != previous_topology_counts:
-            analysis = analyzer.find_problems()
-            diff_msg = cls.diff_analyses(cls.previous_analysis, analysis)
-            if diff_msg is not None:
-                cls.announce(diff_msg)
-                cls.time_complained = time.time()
-            cls.previous_topology_counts = now_counts
-            cls.previous_analysis = analysis
+    @classmethod
+    def expire_complaint(cls):
+        """Clear the header message once it is old enough, return the seconds it still has to stay or None"""
+        if cls.time_complained is None:
+            return None
+        remaining = COMPLAINT_TIMEOUT - (time.time() - cls.time_complained)
+        if remaining > 0:
+            return remaining
+        cls.announce(None)
+        cls.time_complained = None
+        return None
 
-        if cls.time_complained is not None and time.time() - cls.time_complained > COMPLAINT_TIMEOUT:
-            cls.announce(None)
-            cls.time_complained = None
+    @classmethod
+    def publish(cls, analysis):
+        """Announce what changed since the previous analysis and keep the new one"""
+        cls.new_problems, cls.resolved_problems = analysis.diff(cls.previous_analysis)
+        diff_msg = cls.diff_analyses(cls.new_problems, cls.resolved_problems)
+        if diff_msg is not None:
+            cls.announce(diff_msg)
+            cls.time_complained = time.time()
+        cls.previous_analysis = analysis
 
     @classmethod
-    def diff_analyses(cls, before, after):
+    def diff_analyses(cls, new, resolved):
         """
-        Compare two analysis results (before and after) and generate a human-readable report.
-        If certain checks contain more elements in 'after' than in 'before', the differences
-        are summarized and returned as a report string like
-        "Found Interior Faces: 2 faces, Non Manifold: 1 edge".
+        Turn the newly flagged and newly resolved elements into a human-readable report like
+        "Found Interior Faces: 2 faces (#4, #9); Resolved Tris: 1 face (#12)".
         Returns None if no new issues are found.
         """
-        if before is None:
-            before = MeshLintAnalyzer.none_analysis()
+        found_strings = cls.describe_analysis(new)
+        if not found_strings:
+            return None
+        message = 'Found ' + "; ".join(found_strings)
+        resolved_strings = cls.describe_analysis(resolved)
+        if resolved_strings:
+            message += '; Resolved ' + "; ".join(resolved_strings)
+        return message
+
+    @staticmethod
+    def describe_analysis(analysis):
+        """One "Label: 2 faces (#4, #9)" string per check that flags something, listing the first indices"""
         report_strings = []
-        dict_before = cls.make_labels_dict(before)
-        dict_now = cls.make_labels_dict(after)
-        for check in MeshLintAnalyzer.CHECKS:
-            check_name = check['label']
-            if check_name not in dict_now:
-                continue
-            report = dict_now[check_name]
-            report_before = dict_before.get(check_name, {})
+        for report in analysis:
             check_elem_strings = []
-            for elemtype, elem_list in report.items():
-                elem_list_before = report_before.get(elemtype, [])
-                if len(elem_list) > len(elem_list_before):
-                    count_diff = len(elem_list) - len(elem_list_before)
-                    check_elem_strings.append(str(count_diff) + ' ' + depluralize(count = count_diff, string = elemtype))
+            for elemtype in ELEM_TYPES:
+                count = report.count(elemtype)
+                if not count:
+                    continue
+                where = ', '.join('#' + str(index) for index in report.indices(elemtype)[:MAX_LISTED_INDICES].tolist())
+                if count > MAX_LISTED_INDICES:
+                    where += ', ...'
+                check_elem_strings.append(str(count) + ' ' + depluralize(count = count, string = elemtype) + ' (' + where + ')')
             if check_elem_strings:
-                report_strings.append(check_name + ': ' + ', '.join(check_elem_strings))
-        if report_strings:
-            return 'Found ' + "; ".join(report_strings)
-        return None
-
-    @classmethod
-    def make_labels_dict(cls, analysis):
-        if analysis is None:
-            return {}
-        labels_dict = {}
-        for check in analysis:
-            label = check['lint']['label']
-            new_val = check.copy()
-            del new_val['lint']
-            labels_dict[label] = new_val
-        return labels_dict
+                report_strings.append(report.lint['label'] + ': ' + ', '.join(check_elem_strings))
+        return report_strings
 
     @classmethod
     def announce(cls, message):
         """If the INFO box is open then print a message to the header area
         This is way easier than writing into that confounded box"""
-        for area in bpy.context.screen.areas:
-            if "INFO" != area.type:
-                continue
-            if message is None:
-                # Passing None clears the header text;
-                # skipping would leave the previous message displayed
-                area.header_text_set(None)
-            else:
-                area.header_text_set('[MeshLint] ' + message)
\ No newline at end of file
+        for window in bpy.context.window_manager.windows:
+            # Timers run without a screen in their context, so go through every window
+            for area in window.screen.areas:
+                if "INFO" != area.type:
+                    continue
+                if message is None:
+                    # Passing None clears the header text;
+                    # skipping would leave the previous message displayed
+                    area.header_text_set(None)
+                else:
+                    area.header_text_set('[MeshLint] ' + message)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import re
+
+import bpy
+
+from MeshLint.addons.MeshLint.meshLint.utilities import MAX_CRITICISMS
+
+DEFAULT_NAMES = [
+    'BezierCircle',
+    'BezierCurve',
+    'Circle',
+    'Cone',
+    'Cube',
+    'CurvePath',
+    'Cylinder',
+    'Grid',
+    'Icosphere',
+    'Mball',
+    'Monkey',
+    'NurbsCircle',
+    'NurbsCurve',
+    'NurbsPath',
+    'Plane',
+    'Sphere',
+    'Surface',
+    'SurfCircle',
+    'SurfCurve',
+    'SurfCylinder',
+    'SurfPatch',
+    'SurfSphere',
+    'SurfTorus',
+    'Text',
+    'Torus',
+]
+BAD_NAME_PATTERN = re.compile(rf"{'|'.join(DEFAULT_NAMES)}\.?\d*$")
+
+
+@bpy.app.handlers.persistent
+def meshlint_gbl_criticism_invalidate(scene, depsgraph):
+    # Renames, scale edits and selection changes all come through here
+    MeshLintCriticism.dirty = True
+
+
+class MeshLintCriticism:
+    """Complaints about the selected objects themselves (unapplied scale, default name).
+
+    They are gathered once per depsgraph update instead of on every redraw of the side panel, and
+    only the first MAX_CRITICISMS are turned into labels, followed by a "+N more" line."""
+    dirty = True
+    found = []      # (object name, complaint) pairs, in selection order
+
+    @staticmethod
+    def has_unapplied_scale(scale):
+        return len([c for c in scale if c == 1.0]) != 3
+
+    @staticmethod
+    def is_bad_name(name):
+        return BAD_NAME_PATTERN.match(name) is not None
+
+    @classmethod
+    def find(cls, objects):
+        found = []
+        for obj in objects:
+            if cls.has_unapplied_scale(obj.scale):
+                found.append((obj.name, 'has an unapplied scale'))
+            if cls.is_bad_name(obj.name):
+                found.append((obj.name, 'is not a great name'))
+        return found
+
+    @classmethod
+    def findings(cls, context):
+        """The complaints about the selected objects, gathered again only after a depsgraph update"""
+        if cls.dirty:
+            cls.found = cls.find(context.selected_objects)
+            cls.dirty = False
+        return cls.found
+
+    @staticmethod
+    def render(found, total_problems, limit = None):
+        """Turn complaints into the panel sentences, the first one starting with "but" when the
+        meshes themselves are clean, and cut them at limit with a summary of the rest"""
+        criticisms = []
+        for position, (name, crit) in enumerate(found[:limit]):
+            conjunction = 'and also' if total_problems > 0 or position > 0 else 'but'
+            criticisms.append(f'...{conjunction} "{name}" {crit}.')
+        if limit is not None and len(found) > limit:
+            criticisms.append(f'...+{len(found) - limit} more')
+        return criticisms
+
+    @classmethod
+    def lines(cls, context, total_problems):
+        return cls.render(cls.findings(context), total_problems, MAX_CRITICISMS)
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(meshlint_gbl_criticism_invalidate)
+
+
+def unregister():
+    if meshlint_gbl_criticism_invalidate in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(meshlint_gbl_criticism_invalidate)
+    MeshLintCriticism.dirty = True
@@ -0,0 +1,90 @@
+from MeshLint.addons.MeshLint.meshLint.utilities import ELEM_TYPES, exhaust
+
+# Per-element facts a check may ask for. Each getter receives the BMesh element and the running scan.
+FACTS = {
+    'verts' : {
+        'valence' : lambda vvv, scan: len(vvv.link_edges),
+        'manifold' : lambda vvv, scan: vvv.is_manifold,
+    },
+    'edges' : {
+        'face_count' : lambda eee, scan: len(eee.link_faces),
+    },
+    'faces' : {
+        'size' : lambda fff, scan: len(fff.verts),
+        'min_edge_faces' : lambda fff, scan: min(scan.edge_face_count(eee) for eee in fff.edges),
+    },
+}
+
+# Facts computed from the facts of another element type, which then has to be visited first.
+FACT_NEEDS = {
+    ('faces', 'min_edge_faces') : ('edges', 'face_count'),
+}
+
+
+class MeshLintFusedScan:
+    """Visit every vertex, edge and face of the BMesh once, compute only the facts the given checks declare
+    and drop each element into the bucket of every check that flags it.
+
+    A check is a (symbol, facts, flag) triple: facts maps an element type to the fact names it reads,
+    flag(elemtype, facts) returns True when the element is a problem.
+    Passing elements (element type -> BMesh elements) restricts the pass to those elements."""
+
+    def __init__(self, b, checks, elements = None):
+        self.b = b
+        self.checks = checks
+        self.elements = elements
+        self.edge_face_counts = None
+
+    def needed_facts(self):
+        """Collect the fact names to compute for each element type, including the ones other facts rely on"""
+        needed = {elemtype : [] for elemtype in ELEM_TYPES}
+        for _, facts, _ in self.checks:
+            for elemtype, names in facts.items():
+                for name in names:
+                    dependency = FACT_NEEDS.get((elemtype, name))
+                    if dependency is not None and dependency[1] not in needed[dependency[0]]:
+                        needed[dependency[0]].append(dependency[1])
+                    if name not in needed[elemtype]:
+                        needed[elemtype].append(name)
+        return needed
+
+    def edge_face_count(self, eee):
+        """Face count of an edge, read back from the edge pass when it ran"""
+        if self.edge_face_counts is None:
+            return len(eee.link_faces)
+        return self.edge_face_counts[eee.index]
+
+    def run(self):
+        """Return the flagged indices of every check, keyed by symbol then element type"""
+        return exhaust(self.iter_run())
+
+    def iter_run(self, step = 1024):
+        """Generator version of run(): yields after every step elements so the caller can spread
+        the pass over several timer ticks, and returns the flagged indices"""
+        found = {symbol : {elemtype : [] for elemtype in facts} for symbol, facts, _ in self.checks}
+        needed = self.needed_facts()
+        for elemtype in ELEM_TYPES:
+            names = needed[elemtype]
+            if not names:
+                continue
+            getters = [(name, FACTS[elemtype][name]) for name in names]
+            judges = [(found[symbol][elemtype], flag) for symbol, facts, flag in self.checks if elemtype in facts]
+            if self.elements is None:
+                elems = getattr(self.b, elemtype)
+            else:
+                elems = self.elements.get(elemtype, ())
+            keep_face_counts = self.elements is None and elemtype == 'edges' and 'min_edge_faces' in needed['faces']
+            if keep_face_counts:
+                face_counts = [0] * len(elems)
+            for position, elem in enumerate(elems, 1):
+                if position % step == 0:
+                    yield
+                facts = {name : get(elem, self) for name, get in getters}
+                for indices, flag in judges:
+                    if flag(elemtype, facts):
+                        indices.append(elem.index)
+                if keep_face_counts:
+                    face_counts[elem.index] = facts['face_count']
+            if keep_face_counts:
+                self.edge_face_counts = face_counts
+        return found
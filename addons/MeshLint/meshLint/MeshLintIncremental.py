@@ -0,0 +1,125 @@
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.utilities import ELEM_TYPES, exhaust, INCREMENTAL_MAX_SHARE
+
+
+class MeshLintIncremental:
+    """Per-element lint state kept between two continuous checks of the same mesh.
+
+    Each run snapshots the topology in bulk and compares it with the previous snapshot. Edits that add
+    or remove elements (extrude, delete, knife, subdivide, inset...) append them to the element arrays
+    or take them off their end, so the arrays are compared over their common length and the elements
+    past it count as changed. The faces are compared up to the first one whose corners moved, the
+    faces from there on counting as changed too. The verts of the changed edges and faces, before and
+    after, and the new verts are touched: those verts, their edges and their faces (the one-ring) are
+    re-checked and merged into the kept buckets, the removed elements leave them, which gives the same
+    result as a full analysis. When the enabled checks changed, or more than INCREMENTAL_MAX_SHARE of
+    the edges and faces changed (a removal in the middle renumbers everything after it), everything is
+    checked again."""
+
+    def __init__(self):
+        self.data = None        # Pointer of the mesh the buckets belong to
+        self.symbols = None
+        self.arrays = None
+        self.buckets = None
+        self.rechecked = None   # Number of elements re-checked by the last update, None after a full run
+
+    def clear(self):
+        self.__init__()
+
+    def update(self, analyzer):
+        """Bring the kept buckets up to date with the analyzer mesh and return the analysis"""
+        return exhaust(self.iter_update(analyzer))
+
+    def iter_update(self, analyzer):
+        """Generator version of update(), yielding between slices of the checks"""
+        lints = analyzer.enabled_checks()
+        symbols = tuple(lint['symbol'] for lint in lints)
+        arrays = analyzer.topology_arrays()
+        touched = None
+        if self.buckets is not None and self.data == analyzer.obj.data.as_pointer() and self.symbols == symbols:
+            touched = self.touched_verts(self.arrays, arrays)
+        if touched is None:
+            self.rechecked = None
+            found = yield from analyzer.iter_run_checks(lints)
+            self.buckets = {symbol : {elemtype : set(np.asarray(indices).tolist()) for elemtype, indices in bad.items()}
+                            for symbol, bad in found.items()}
+        else:
+            self.drop_removed(arrays)
+            if len(touched):
+                yield from self.iter_recheck(analyzer, lints, touched)
+            else:
+                self.rechecked = 0
+        self.data = analyzer.obj.data.as_pointer()
+        self.symbols = symbols
+        self.arrays = arrays
+        found = {symbol : {elemtype : sorted(indices) for elemtype, indices in bad.items()}
+                 for symbol, bad in self.buckets.items()}
+        return analyzer.report_problems(lints, found)
+
+    @staticmethod
+    def touched_verts(before, after):
+        """Return the verts of after whose surroundings changed between two snapshots,
+        or None when too much changed for a partial check to pay off"""
+        # Edges: compared over the common length, the ones past it were added or removed
+        num_edges = min(before.num_edges, after.num_edges)
+        changed_edges = np.flatnonzero((before.edge_verts[:num_edges] != after.edge_verts[:num_edges]).any(axis=1))
+        # Faces: the ones before the first face whose corners moved are compared corner by corner
+        num_faces = min(before.num_faces, after.num_faces)
+        moved = (before.loop_starts[:num_faces] != after.loop_starts[:num_faces]) | \
+                (before.face_sizes[:num_faces] != after.face_sizes[:num_faces])
+        first_moved = int(np.argmax(moved)) if moved.any() else num_faces
+        num_loops = int(after.loop_starts[first_moved]) if first_moved < after.num_faces else after.num_loops
+        num_loops = min(num_loops, before.num_loops)
+        changed_loops = (before.loop_verts[:num_loops] != after.loop_verts[:num_loops]) | \
+                        (before.loop_edges[:num_loops] != after.loop_edges[:num_loops])
+        changed_faces = np.zeros(first_moved, dtype=bool)
+        if changed_loops.any():
+            faces_of_loops = np.repeat(np.arange(first_moved), after.face_sizes[:first_moved])
+            changed_faces[faces_of_loops[np.flatnonzero(changed_loops)]] = True
+
+        changed = len(changed_edges) + max(before.num_edges, after.num_edges) - num_edges + \
+            int(changed_faces.sum()) + max(before.num_faces, after.num_faces) - first_moved
+        if changed > INCREMENTAL_MAX_SHARE * max(after.num_edges + after.num_faces, 1):
+            return None
+
+        def face_verts(arrays):
+            loops = np.repeat(np.concatenate((changed_faces, np.ones(arrays.num_faces - first_moved, dtype=bool))),
+                              arrays.face_sizes)
+            return arrays.loop_verts[loops]
+
+        touched = np.unique(np.concatenate((
+            before.edge_verts[changed_edges].ravel(), before.edge_verts[num_edges:].ravel(),
+            after.edge_verts[changed_edges].ravel(), after.edge_verts[num_edges:].ravel(),
+            face_verts(before), face_verts(after),
+            np.arange(min(before.num_verts, after.num_verts), after.num_verts),
+        )))
+        # The removed verts only leave the buckets
+        return touched[touched < after.num_verts]
+
+    def drop_removed(self, arrays):
+        """Take the elements past the end of the new snapshot out of the buckets"""
+        sizes = {'verts' : arrays.num_verts, 'edges' : arrays.num_edges, 'faces' : arrays.num_faces}
+        for bad in self.buckets.values():
+            for elemtype, bucket in bad.items():
+                removed = [index for index in bucket if index >= sizes[elemtype]]
+                bucket.difference_update(removed)
+
+    def iter_recheck(self, analyzer, lints, touched):
+        """Check the touched verts with their edges and faces again and merge them into the buckets"""
+        b = analyzer.b
+        b.verts.ensure_lookup_table()
+        verts = [b.verts[i] for i in touched.tolist()]
+        edges = {eee.index : eee for vvv in verts for eee in vvv.link_edges}
+        faces = {fff.index : fff for vvv in verts for fff in vvv.link_faces}
+        elements = {'verts' : verts, 'edges' : list(edges.values()), 'faces' : list(faces.values())}
+        rechecked = {'verts' : set(touched.tolist()), 'edges' : set(edges), 'faces' : set(faces)}
+        found = yield from analyzer.iter_run_checks(lints, elements = elements)
+        for symbol, bad in found.items():
+            for elemtype in ELEM_TYPES:
+                if elemtype not in bad:
+                    continue
+                bucket = self.buckets[symbol].setdefault(elemtype, set())
+                bucket -= rechecked[elemtype]
+                bucket.update(bad[elemtype])
+        self.rechecked = sum(len(indices) for indices in rechecked.values())
@@ -1,76 +1,190 @@
-import bpy, bmesh
+import time
 
-from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
-from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
-from MeshLint.addons.MeshLint.meshLint.utilities import ELEM_TYPES, activate, ensure_not_edit_mode, is_edit_mode
+import bpy
 
-def deselect_all_elements(obj):
-    """
-    Deselect all vertices/edges/faces of a mesh object in Edit Mode,
-    using bmesh API (works even in multi-object edit mode).
-    """
-    if obj.type != "MESH":
-        return
+from MeshLint.addons.MeshLint.meshLint.MeshLintCache import MeshLintCache
+from MeshLint.addons.MeshLint.meshLint.utilities import activate, exhaust, TICK_BUDGET_MS, ARRAY_WINDOW_BYTES
 
-    bm = bmesh.from_edit_mesh(obj.data)
+# Events a running modal examination lets through: looking around, but no edits under the analysis
+NAVIGATION_EVENTS = {
+    'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE',
+    'TRACKPADPAN', 'TRACKPADZOOM', 'NDOF_MOTION', 'TIMER', 'TIMER_REPORT',
+}
 
-    for v in bm.verts:
-        v.select = False
-    for e in bm.edges:
-        e.select = False
-    for f in bm.faces:
-        f.select = False
 
-    bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+class MeshLintObjectLooper:
+    """Class providing methods to run lint checks on active and selected mesh objects in the scene.
 
+    Every examination also has a generator version yielding (objects done, objects) between objects
+    and between the slices of the checks of large meshes. Operators run those from invoke() with
+    start_job(): a window timer advances the job for at most meshlint_tick_budget milliseconds per
+    event, the progress goes to the window manager and to the side panel, and Esc stops it with
+    the counts of the objects done so far kept in MeshLintStore."""
+    progress = None     # (objects done, objects) of the running modal examination
 
-class MeshLintObjectLooper:
-    """Class providing methods to run lint checks on active and selected mesh objects in the scene."""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs) # For blender 4.4 onwards
         self.original_active = bpy.context.active_object
         self.troubled_meshes = []
+        self.analyses = {}
+
+    @staticmethod
+    def new_analyzer(**kwargs):
+        """A MeshLintAnalyzer, imported on the first call: the operators built on this class are registered
+        at startup, the analysis modules and NumPy are only imported once something is checked"""
+        from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+        return MeshLintAnalyzer(**kwargs)
+
+    @staticmethod
+    def cleared_store():
+        """The MeshLintStore, emptied for a new examination"""
+        from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
+        store = MeshLintStore()
+        store.clear()
+        return store
 
     @staticmethod
     def examine_single_object(obj=None):
         """Conduct lint analysis of the selected object,return True if the mesh is clean."""
         if obj:
-            analyzer = MeshLintAnalyzer(obj = obj)
+            analyzer = MeshLintObjectLooper.new_analyzer(obj = obj)
         else:
-            analyzer = MeshLintAnalyzer()
-        analyzer.enable_anything_select_mode()
-        deselect_all_elements(analyzer.obj)
-        analysis = analyzer.find_problems()
-        for lint in analysis:
-            for elemtype in ELEM_TYPES:
-                indices = lint[elemtype]
-                analyzer.enable_anything_select_mode()
-                analyzer.select_indices(elemtype, indices)
+            analyzer = MeshLintObjectLooper.new_analyzer()
+        analysis = MeshLintCache().find_problems(analyzer)
+        analyzer.select_analysis(analysis)
         print('select all the issues')
         for area in bpy.context.screen.areas:
             if area.type == 'VIEW_3D':  # Headless Blender does not have a VIEW_3D for a redraw event.
                 area.tag_redraw()       # 'NoneType' object has no attribute 'tag_redraw' when headless
-        check = MeshLintAnalyzer.CHECKS
+        check = analyzer.results()
         return check, analyzer.found_zero_problems()
 
-    def examine_all_selected_meshes(self):
-        """For the current object plus all selected objects do lint analysis."""
-        store = MeshLintStore()
-        store.clear()
-        clean = False
+    @staticmethod
+    def examine_object_data(obj):
+        """Conduct lint analysis of an object in object mode, straight from its mesh data.
+        Nothing is selected, return the checks, the analysis and True if the mesh is clean."""
+        (check, analysis, good, _), = MeshLintObjectLooper.examine_objects_data([obj])
+        return check, analysis, good
+
+    @staticmethod
+    def array_windows(objs):
+        """Split the objects into runs whose meshes take at most ARRAY_WINDOW_BYTES of topology arrays
+        together, at least one object each: a run is read at once and its array checks run side by side,
+        then its arrays are let go before the next one is read."""
+        from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import MeshLintArrays
+        window, meshes, nbytes = [], set(), 0
+        for obj in objs:
+            size = 0 if obj.data in meshes else MeshLintArrays.estimate_nbytes(obj.data)
+            if window and nbytes + size > ARRAY_WINDOW_BYTES:
+                yield window
+                window, meshes, nbytes = [], set(), 0
+                size = MeshLintArrays.estimate_nbytes(obj.data)
+            window.append(obj)
+            meshes.add(obj.data)
+            nbytes += size
+        if window:
+            yield window
+
+    @staticmethod
+    def examine_objects_data(objs):
+        """examine_object_data() of several objects, their array checks running side by side a window of
+        objects at a time (array_windows()). Each result also holds the histograms of the mesh when the
+        side panel shows them, or None."""
+        results = []
+        for window in MeshLintObjectLooper.array_windows(objs):
+            analyzers = [MeshLintObjectLooper.new_analyzer(obj = obj, edit_mode = False) for obj in window]
+            try:
+                analyses = MeshLintCache().find_problems_all(analyzers)
+            finally:
+                for analyzer in analyzers:
+                    analyzer.free()
+            results.extend((analyzer.results(), analysis, analyzer.found_zero_problems(), analyzer.shown_histograms())
+                           for analyzer, analysis in zip(analyzers, analyses))
+        return results
+
+    def select_troubled_elements(self):
+        """Write the selection of the flagged elements into the troubled meshes before entering edit mode"""
+        for obj in self.troubled_meshes:
+            analyzer = self.new_analyzer(obj = obj, edit_mode = False)
+            analyzer.select_analysis(self.analyses[obj])
+
+    def selected_examinees(self):
+        """The current object plus all selected objects"""
         if self.original_active and self.original_active not in bpy.context.selected_objects:
-           examinees = [self.original_active] + bpy.context.selected_objects
-        else:
-            examinees = bpy.context.selected_objects
-        for obj in examinees:
-            if obj.type != "MESH":
-                continue
-            activate(obj)
-            check, good = self.examine_single_object()
-            store.add_counts(check)
-            ensure_not_edit_mode()
+           return [self.original_active] + bpy.context.selected_objects
+        return bpy.context.selected_objects
+
+    @staticmethod
+    def iter_progress(job, done, total):
+        """Run a generator to its end, yielding (done, total) in place of its slices, and hand back its return value"""
+        while True:
+            try:
+                next(job)
+            except StopIteration as stop:
+                return stop.value
+            yield done, total
+
+    def examine_all_selected_meshes(self):
+        """For the current object plus all selected objects do lint analysis.
+        This stays in object mode, select_troubled_elements() writes the problems selection afterwards."""
+        store = self.cleared_store()
+        examinees = self.selected_examinees()
+        meshes = [obj for obj in examinees if obj.type == "MESH"]
+        for obj, (check, analysis, good, histograms) in zip(meshes, self.examine_objects_data(meshes)):
+            store.add_counts(check, key = obj.name, histograms = histograms)
             if not good:
                 self.troubled_meshes.append(obj)
+                self.analyses[obj] = analysis
+        return self.handle_examined_meshes(examinees)
+
+    def iter_examine_all_selected_meshes(self):
+        """Generator version of examine_all_selected_meshes(), checking one object after the other"""
+        store = self.cleared_store()
+        examinees = self.selected_examinees()
+        meshes = [obj for obj in examinees if obj.type == "MESH"]
+        for done, obj in enumerate(meshes):
+            analyzer = self.new_analyzer(obj = obj, edit_mode = False)
+            try:
+                analysis = yield from self.iter_progress(MeshLintCache().iter_find_problems(analyzer), done, len(meshes))
+            finally:
+                analyzer.free()
+            store.add_counts(analyzer.results(), key = obj.name, histograms = analyzer.shown_histograms())
+            if not analyzer.found_zero_problems():
+                self.troubled_meshes.append(obj)
+                self.analyses[obj] = analysis
+            yield done + 1, len(meshes)
+        return self.handle_examined_meshes(examinees)
+
+    def find_all_troubled_meshes(self):
+        """For the current object plus all selected objects only find out which meshes have any lint,
+        with MeshLintAnalyzer.is_clean(): nothing is counted nor selected, and a mesh shared by several
+        objects is asked once."""
+        return exhaust(self.iter_find_all_troubled_meshes())
+
+    def iter_find_all_troubled_meshes(self):
+        """Generator version of find_all_troubled_meshes()"""
+        examinees = self.selected_examinees()
+        meshes = [obj for obj in examinees if obj.type == "MESH"]
+        clean = {}
+        for done, obj in enumerate(meshes):
+            if obj.data not in clean:
+                analyzer = self.new_analyzer(obj = obj, edit_mode = False)
+                clean[obj.data] = analyzer.is_clean()
+            if not clean[obj.data]:
+                self.troubled_meshes.append(obj)
+            yield done + 1, len(meshes)
+        return self.handle_examined_meshes(examinees)
+
+    @staticmethod
+    def release_topologies():
+        """Drop the cached topology indices of the examined meshes: their results stay in MeshLintCache,
+        and nothing else reuses the indices once the examination is done"""
+        from MeshLint.addons.MeshLint.meshLint.MeshLintTopology import MeshLintTopology
+        MeshLintTopology.clear()
+
+    def handle_examined_meshes(self, examinees):
+        """Keep only the troubled meshes selected, return True if all meshes were clean"""
+        self.release_topologies()
         priorities = examinees
         for obj in priorities:
             if obj.select_get:
@@ -90,14 +204,93 @@ class MeshLintObjectLooper:
 
     def examine_all_edit_meshes(self):
         """For the all edit objects do lint analysis."""
-        store = MeshLintStore()
-        store.clear()
-        examinees = bpy.context.objects_in_mode_unique_data
-        for obj in examinees:
-            if obj.type != "MESH":
-                continue
-            check, _ = self.examine_single_object(obj)
-            store.add_counts(check)
+        store = self.cleared_store()
+        meshes = [obj for obj in bpy.context.objects_in_mode_unique_data if obj.type == "MESH"]
+        for window in self.array_windows(meshes):
+            analyzers = [self.new_analyzer(obj = obj) for obj in window]
+            # The meshes are read one after the other, their array checks then run side by side
+            analyses = MeshLintCache().find_problems_all(analyzers)
+            for analyzer, analysis in zip(analyzers, analyses):
+                analyzer.select_analysis(analysis)
+                store.add_counts(analyzer.results(), key = analyzer.obj.name, histograms = analyzer.shown_histograms())
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':  # Headless Blender does not have a VIEW_3D for a redraw event.
+                area.tag_redraw()
+
+    def iter_examine_all_edit_meshes(self):
+        """Generator version of examine_all_edit_meshes(), checking and selecting one object after the other"""
+        store = self.cleared_store()
+        meshes = [obj for obj in bpy.context.objects_in_mode_unique_data if obj.type == "MESH"]
+        for done, obj in enumerate(meshes):
+            analyzer = self.new_analyzer(obj = obj)
+            analysis = yield from self.iter_progress(MeshLintCache().iter_find_problems(analyzer), done, len(meshes))
+            analyzer.select_analysis(analysis)
+            store.add_counts(analyzer.results(), key = obj.name, histograms = analyzer.shown_histograms())
+            yield done + 1, len(meshes)
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':  # Headless Blender does not have a VIEW_3D for a redraw event.
+                area.tag_redraw()
+
+    # ---------------- modal runs ----------------
+    def start_job(self, context, job):
+        """Run the job (a generator yielding (done, total)) from window timer events, see modal()"""
+        self.job = job
+        self.job_timer = context.window_manager.event_timer_add(0.0, window = context.window)
+        context.window_manager.progress_begin(0.0, 1.0)
+        context.window_manager.modal_handler_add(self)
+        MeshLintObjectLooper.progress = (0, 0)
+        return {'RUNNING_MODAL'}
+
+    def end_job(self, context):
+        self.job.close()
+        context.window_manager.event_timer_remove(self.job_timer)
+        context.window_manager.progress_end()
+        MeshLintObjectLooper.progress = None
+        self.redraw_panels(context)
+
+    @staticmethod
+    def redraw_panels(context):
+        """Redraw the side panels showing the progress, not the viewports"""
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'UI':
+                        region.tag_redraw()
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.end_job(context)
+            self.report({'WARNING'}, "MeshLint cancelled, the counts of the objects done so far are kept")
+            return {'CANCELLED'}
+        # Any window timer advances the job: an Event does not tell which timer fired it
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'} if event.type in NAVIGATION_EVENTS else {'RUNNING_MODAL'}
+        budget = getattr(context.scene, 'meshlint_tick_budget', TICK_BUDGET_MS) / 1000.0
+        started = time.perf_counter()
+        done, total = MeshLintObjectLooper.progress
+        try:
+            while time.perf_counter() - started < budget:
+                done, total = next(self.job)
+        except StopIteration as stop:
+            self.end_job(context)
+            return self.finish_job(context, stop.value)
+        except ReferenceError:
+            # An object or its mesh went away between two slices (undo, deletion...)
+            self.end_job(context)
+            self.report({'WARNING'}, "MeshLint stopped, an object went away while it was checked")
+            return {'CANCELLED'}
+        except Exception:
+            # Take the timer and the progress bar down before Blender drops the handler
+            self.end_job(context)
+            raise
+        MeshLintObjectLooper.progress = (done, total)
+        context.window_manager.progress_update(done / total if total else 0.0)
+        self.redraw_panels(context)
+        return {'RUNNING_MODAL'}
+
+    def finish_job(self, context, result):
+        """Called with the return value of the job once it is done, returns the operator result"""
+        return {'FINISHED'}
 
     def handle_troubled_meshes(self):
         """Do the deselection of the troubled mesh list."""
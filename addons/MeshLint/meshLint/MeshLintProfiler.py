@@ -0,0 +1,116 @@
+import json
+import logging
+import threading
+import time
+
+import bpy
+
+logger = logging.getLogger('MeshLint.profile')
+
+
+def meshlint_gbl_profile_toggle(scene, context):
+    MeshLintProfiler.enabled = scene.meshlint_profile
+
+
+@bpy.app.handlers.persistent
+def meshlint_gbl_profile_sync(*args):
+    MeshLintProfiler.enabled = getattr(bpy.context.scene, 'meshlint_profile', False)
+
+
+class MeshLintNoStage:
+    """Handed out while profiling is off: entering and leaving it does nothing"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NO_STAGE = MeshLintNoStage()
+
+
+class MeshLintStage:
+    """Times the block it wraps and records it in MeshLintProfiler on the way out"""
+    __slots__ = ('name', 'elements', 'started')
+
+    def __init__(self, name, elements):
+        self.name = name
+        self.elements = elements
+        self.started = None
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.started
+        elements = self.elements() if callable(self.elements) else self.elements
+        MeshLintProfiler.record(self.name, seconds, elements)
+        return False
+
+
+class MeshLintProfiler:
+    """Wall time and element throughput of the stages of a lint run.
+
+    Code paths wrap their stages in `with MeshLintProfiler.stage(name, elements):`, where elements is a
+    count or a function returning it once the stage is over. While profiling is off (the
+    meshlint_profile scene toggle) that returns a shared do-nothing context manager, so the cost is
+    one attribute test per stage. While it is on, each stage is kept as the latest measure of
+    its name, summed into the totals, and sent as a JSON message at INFO level to the
+    'MeshLint.profile' logger, where a farm can attach its own handler.
+
+    Time-sliced stages (the continuous check) are measured from their first to their last slice.
+    """
+    enabled = False
+    latest = {}
+    totals = {}
+    _lock = threading.Lock()    # Stages may end on the worker threads of the array checks
+
+    @classmethod
+    def stage(cls, name, elements = 0):
+        if not cls.enabled:
+            return NO_STAGE
+        return MeshLintStage(name, elements)
+
+    @classmethod
+    def record(cls, name, seconds, elements):
+        entry = {
+            'stage' : name,
+            'seconds' : seconds,
+            'elements' : elements,
+            'per_second' : elements / seconds if seconds > 0 else None,
+            'time' : time.time(),
+        }
+        with cls._lock:
+            cls.latest[name] = entry
+            total = cls.totals.setdefault(name, {'calls' : 0, 'seconds' : 0.0, 'elements' : 0})
+            total['calls'] += 1
+            total['seconds'] += seconds
+            total['elements'] += elements
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(entry))
+
+    @classmethod
+    def reset(cls):
+        cls.latest.clear()
+        cls.totals.clear()
+
+    @classmethod
+    def stats(cls):
+        """Latest measure and totals of every stage, slowest latest stage first"""
+        return {
+            'latest' : sorted(cls.latest.values(), key=lambda entry: entry['seconds'], reverse=True),
+            'totals' : {name : dict(total) for name, total in cls.totals.items()},
+        }
+
+
+def register():
+    bpy.app.handlers.load_post.append(meshlint_gbl_profile_sync)
+
+
+def unregister():
+    if meshlint_gbl_profile_sync in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(meshlint_gbl_profile_sync)
+    MeshLintProfiler.enabled = False
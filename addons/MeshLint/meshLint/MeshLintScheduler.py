@@ -0,0 +1,110 @@
+import time
+import bpy
+
+from MeshLint.addons.MeshLint.meshLint.utilities import MIN_CHECK_INTERVAL, TICK_BUDGET_MS
+
+
+def meshlint_gbl_scheduler_tick():
+    return MeshLintScheduler.tick()
+
+
+class MeshLintScheduler:
+    """Run the continuous check from a bpy.app.timers callback instead of inside the depsgraph handler.
+
+    Depsgraph events only mark a check as pending, so a burst of edits is merged into one analysis.
+    Two analyses start at least meshlint_min_interval seconds apart, and each timer tick advances the
+    running analysis for at most meshlint_tick_budget milliseconds before handing the UI back.
+
+    Statistics:
+      - latency: seconds between the first event of the last burst and its published result
+      - dropped: events that never got a run of their own (merged into a pending one, or abandoned
+        because the mesh they were reading went away)
+    """
+    checker = None
+    pending_since = None
+    job = None
+    job_since = None
+    last_finished = 0.0
+    latency = None
+    slices = 0
+    runs = 0
+    dropped = 0
+
+    @classmethod
+    def request(cls, checker):
+        """Note that the mesh changed, and make sure the timer will look at it"""
+        cls.checker = checker
+        if cls.pending_since is None:
+            cls.pending_since = time.perf_counter()
+        else:
+            cls.dropped += 1
+        if not bpy.app.timers.is_registered(meshlint_gbl_scheduler_tick):
+            bpy.app.timers.register(meshlint_gbl_scheduler_tick, first_interval=0.0)
+
+    @classmethod
+    def cancel(cls):
+        """Forget the pending and running analyses and stop the timer"""
+        if cls.job is not None:
+            cls.job.close()
+            cls.dropped += 1
+        cls.job = None
+        cls.job_since = None
+        cls.pending_since = None
+        if bpy.app.timers.is_registered(meshlint_gbl_scheduler_tick):
+            bpy.app.timers.unregister(meshlint_gbl_scheduler_tick)
+
+    @classmethod
+    def tick(cls):
+        """Timer callback: return the delay before the next call, or None to stop the timer"""
+        scene = bpy.context.scene
+        min_interval = getattr(scene, 'meshlint_min_interval', MIN_CHECK_INTERVAL)
+        budget = getattr(scene, 'meshlint_tick_budget', TICK_BUDGET_MS) / 1000.0
+
+        if cls.job is None:
+            if cls.pending_since is None:
+                return cls.checker.expire_complaint() if cls.checker else None
+            wait = cls.last_finished + min_interval - time.perf_counter()
+            if wait > 0:
+                return wait
+            cls.job = cls.checker.iter_check()
+            cls.job_since = cls.pending_since
+            cls.pending_since = None
+            cls.slices = 0
+
+        started = time.perf_counter()
+        cls.slices += 1
+        try:
+            while time.perf_counter() - started < budget:
+                next(cls.job)
+        except StopIteration:
+            cls.finish()
+        except ReferenceError:
+            # The BMesh went away under the running analysis (undo, mode switch...), run it again
+            cls.job = None
+            cls.dropped += 1
+            cls.pending_since = cls.job_since
+            return 0.0
+        return 0.0
+
+    @classmethod
+    def finish(cls):
+        """Record the statistics of the analysis that just completed"""
+        now = time.perf_counter()
+        cls.latency = now - cls.job_since
+        cls.last_finished = now
+        cls.runs += 1
+        cls.job = None
+        cls.job_since = None
+
+    @classmethod
+    def stats(cls):
+        return {
+            'latency' : cls.latency,
+            'slices' : cls.slices,
+            'runs' : cls.runs,
+            'dropped' : cls.dropped,
+        }
+
+
+def unregister():
+    MeshLintScheduler.cancel()
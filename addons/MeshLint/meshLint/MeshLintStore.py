@@ -1,5 +1,13 @@
-import copy
-from MeshLint.addons.MeshLint.meshLint.utilities import TBD_STR, N_A_STR
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintHistogram
+from MeshLint.addons.MeshLint.meshLint.MeshLintProfiler import MeshLintProfiler
+from MeshLint.addons.MeshLint.meshLint.utilities import TBD_STR, N_A_STR, TOP_OBJECTS
+
+# Codes of the non-numeric counts in the per-object table
+NO_COUNT = -1       # this object did not report the check
+NA_COUNT = -2
+TBD_COUNT = -3
 
 
 class MeshLintStore:
@@ -12,6 +20,12 @@ class MeshLintStore:
           * prefer TBD_STR if any TBD_STR seen
           * else prefer N_A_STR if any N_A_STR seen
           * else 0
+
+    Everything is indexed by check symbol. Counts added with a key (an object name) also go into a
+    per-object table, one int row per object and one column per check; adding the same key again
+    replaces its row and updates the totals by the difference, so re-linting one object does not
+    need a clear() and a full rebuild. `results` keeps the former list of check dicts for display.
+    The valence and face-size histograms of an object can come with its counts, histograms() sums them.
     """
     _instance = None
 
@@ -19,43 +33,44 @@ class MeshLintStore:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.results = []
-            cls._instance._stats = {}
+            cls._instance.clear()
         return cls._instance
 
     def clear(self):
         self.results.clear()
-        self._stats.clear()
+        self._stats = {}        # symbol -> sum, num, na and tbd of the contributions
+        self._by_symbol = {}    # symbol -> its dict in results
+        self._columns = {}      # symbol -> column of the table
+        self._rows = {}         # key -> row of the table
+        self._keys = []         # row -> key
+        self._table = np.full((0, 0), NO_COUNT, dtype=np.int64)
+        self._histograms = {}   # key -> MeshLintHistogram counts keyed by element type
 
     # ---------------- internal helpers ----------------
     @staticmethod
-    def _is_int(v):
-        return isinstance(v, int)
+    def _encode(value):
+        """Table code of a count: the count itself, or one of the negative codes"""
+        if isinstance(value, int):
+            return value
+        if value == N_A_STR:
+            return NA_COUNT
+        if value == TBD_STR:
+            return TBD_COUNT
+        try:
+            return int(value)
+        except Exception:
+            return NO_COUNT  # ignore unknowns
 
     @staticmethod
-    def _is_na(v):
-        return v == N_A_STR
-
-    @staticmethod
-    def _is_tbd(v):
-        return v == TBD_STR
-
-    @classmethod
-    def _update_stats(cls, stats, value):
-        """Update stats dict with a new value"""
-        if cls._is_int(value):
-            stats['sum'] += value
-            stats['num'] += 1
-        elif cls._is_na(value):
-            stats['na'] += 1
-        elif cls._is_tbd(value):
-            stats['tbd'] += 1
-        else:
-            try:
-                iv = int(value)
-                stats['sum'] += iv
-                stats['num'] += 1
-            except Exception:
-                pass  # ignore unknowns
+    def _update_stats(stats, code, sign = 1):
+        """Add (or with sign=-1 take back) one encoded contribution"""
+        if code >= 0:
+            stats['sum'] += sign * code
+            stats['num'] += sign
+        elif code == NA_COUNT:
+            stats['na'] += sign
+        elif code == TBD_COUNT:
+            stats['tbd'] += sign
 
     @staticmethod
     def _decide_display(stats):
@@ -68,36 +83,106 @@ class MeshLintStore:
             return N_A_STR
         return 0
 
+    def _add_symbol(self, lint):
+        symbol = lint.get('symbol')
+        self._stats[symbol] = {'sum' : 0, 'num' : 0, 'na' : 0, 'tbd' : 0}
+        entry = dict(lint)
+        self._by_symbol[symbol] = entry
+        self.results.append(entry)
+        self._columns[symbol] = len(self._columns)
+        if self._table.shape[1] < len(self._columns):
+            grown = np.full((self._table.shape[0], max(8, 2 * len(self._columns))), NO_COUNT, dtype=np.int64)
+            grown[:, :self._table.shape[1]] = self._table
+            self._table = grown
+
+    def _row(self, key):
+        """Row of key in the table, added when the key is new"""
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == self._table.shape[0]:
+                grown = np.full((max(16, 2 * row), self._table.shape[1]), NO_COUNT, dtype=np.int64)
+                grown[:row] = self._table
+                self._table = grown
+            self._rows[key] = row
+            self._keys.append(key)
+        return row
+
+    def _take_back(self, row):
+        for symbol, column in self._columns.items():
+            # Plain ints, so that no NumPy scalar reaches the totals shown and written as JSON
+            self._update_stats(self._stats[symbol], int(self._table[row, column]), -1)
+
+    def _refresh(self, symbols):
+        for symbol in symbols:
+            self._by_symbol[symbol]['count'] = self._decide_display(self._stats[symbol])
+
     # ---------------- public API ----------------
-    def add_counts(self, new_checks):
+    def add_counts(self, new_checks, key = None, histograms = None):
+        """Add the counts of one object. With a key, a previous add of the same key is replaced,
+        along with its histograms (MeshLintAnalyzer.topology_stats()), if any."""
         if not isinstance(new_checks, list):
             raise TypeError("new_checks must be a list")
+        with MeshLintProfiler.stage('store', len(new_checks)):
+            for new_lint in new_checks:
+                if new_lint.get('symbol') not in self._stats:
+                    self._add_symbol(new_lint)
+            codes = [(new_lint.get('symbol'), self._encode(new_lint.get('count', 0))) for new_lint in new_checks]
+            touched = [symbol for symbol, _ in codes]
+            if key is not None:
+                self._histograms.pop(key, None)
+                if histograms is not None:
+                    # Only the counts are kept, not the values of every element
+                    self._histograms[key] = {elemtype : histogram.summary() for elemtype, histogram in histograms.items()}
+                row = self._row(key)
+                self._take_back(row)
+                self._table[row] = NO_COUNT
+                touched = self._columns
+            for symbol, code in codes:
+                self._update_stats(self._stats[symbol], code)
+                if key is not None:
+                    self._table[row, self._columns[symbol]] = code
+            self._refresh(touched)
 
-        if not self.results:  # first add
-            self.results = copy.deepcopy(new_checks)
-            for lint in self.results:
-                s = {'sum': 0, 'num': 0, 'na': 0, 'tbd': 0}
-                self._update_stats(s, lint.get('count', 0))
-                lint['count'] = self._decide_display(s)
-                self._stats[lint['symbol']] = s
+    def remove(self, key):
+        """Take the counts of one object back out of the totals"""
+        self._histograms.pop(key, None)
+        row = self._rows.pop(key, None)
+        if row is None:
             return
+        self._take_back(row)
+        last = len(self._keys) - 1
+        if row != last:
+            self._table[row] = self._table[last]
+            self._keys[row] = self._keys[last]
+            self._rows[self._keys[row]] = row
+        self._table[last] = NO_COUNT
+        self._keys.pop()
+        self._refresh(self._columns)
+
+    def count(self, symbol):
+        """Displayed total of one check"""
+        return self._by_symbol[symbol]['count']
+
+    def object_counts(self, key):
+        """Counts of one object keyed by check symbol"""
+        row = self._table[self._rows[key]]
+        decode = {NA_COUNT : N_A_STR, TBD_COUNT : TBD_STR}
+        return {symbol : decode.get(int(row[column]), int(row[column]))
+                for symbol, column in self._columns.items() if row[column] != NO_COUNT}
+
+    def histograms(self):
+        """The histograms of all the objects added with theirs, summed per element type"""
+        merged = {}
+        for elemtype in ('verts', 'faces'):
+            histograms = [entry[elemtype] for entry in self._histograms.values() if elemtype in entry]
+            if histograms:
+                merged[elemtype] = MeshLintHistogram.merge(histograms)
+        return merged
 
-        for new_lint in new_checks:
-            symbol, cnt = new_lint.get('symbol'), new_lint.get('count', 0)
-            stats = self._stats.get(symbol)
-
-            if stats is None:  # brand new symbol
-                stats = {'sum': 0, 'num': 0, 'na': 0, 'tbd': 0}
-                self._update_stats(stats, cnt)
-                self._stats[symbol] = stats
-                lint_copy = copy.deepcopy(new_lint)
-                lint_copy['count'] = self._decide_display(stats)
-                self.results.append(lint_copy)
-                continue
-
-            # update existing
-            self._update_stats(stats, cnt)
-            for lint in self.results:
-                if lint.get('symbol') == symbol:
-                    lint['count'] = self._decide_display(stats)
-                    break
+    def top_objects(self, limit = TOP_OBJECTS):
+        """The objects with the most problems, as (key, problems) pairs, worst first"""
+        rows = self._table[:len(self._keys), :len(self._columns)]
+        problems = np.where(rows > 0, rows, 0).sum(axis=1)
+        worst = np.argsort(-problems, kind='stable')[:limit]
+        return [(self._keys[row], int(problems[row])) for row in worst.tolist() if problems[row] > 0]
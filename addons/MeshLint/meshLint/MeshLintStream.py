@@ -0,0 +1,355 @@
+import ctypes
+import hashlib
+import os
+import tempfile
+
+import bpy
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintBitset, MeshLintHistogram
+from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import connected_labels
+from MeshLint.addons.MeshLint.meshLint.MeshLintProfiler import MeshLintProfiler
+from MeshLint.addons.MeshLint.meshLint.utilities import STREAM_CHUNK
+
+# The int32 arrays a stream reads: the attribute holding each one (the face offsets are not an
+# attribute), then the collection property and width foreach_get reads when it cannot be reached
+SOURCES = {
+    'edge_verts' : ('.edge_verts', 'edges', 'vertices', 2),
+    'corner_verts' : ('.corner_vert', 'loops', 'vertex_index', 1),
+    'corner_edges' : ('.corner_edge', 'loops', 'edge_index', 1),
+    'face_offsets' : (None, 'polygons', 'loop_start', 1),
+}
+
+# Element types flagged by each check a stream can run
+FLAGGED = {
+    'tris' : ('faces',),
+    'ngons' : ('faces',),
+    'interior_faces' : ('faces',),
+    'nonmanifold' : ('verts', 'edges'),
+    'three_poles' : ('verts',),
+    'five_poles' : ('verts',),
+    'sixplus_poles' : ('verts',),
+}
+
+
+def accumulate(counts, indices, cap):
+    """counts[i] += the number of times i is in indices, saturating at cap"""
+    found, times = np.unique(indices, return_counts=True)
+    counts[found] = np.minimum(counts[found] + times, cap)
+
+
+def set_bits(bits, start, mask):
+    """Set the bits of the flagged elements of mask, the elements start onwards, in a np.packbits bitset"""
+    head = min(-start % 8, len(mask))
+    for offset in np.flatnonzero(mask[:head]).tolist():
+        bits[(start + offset) >> 3] |= 0x80 >> ((start + offset) & 7)
+    packed = np.packbits(mask[head:])
+    first = (start + head) >> 3
+    bits[first:first + len(packed)] |= packed
+
+
+class MeshLintChunkReader:
+    """Ranges of one int32 array of a mesh, copied into a buffer reused from one chunk to the next.
+
+    From Blender 4.0 the array is read where it lies: as_pointer() of its first item gives its address
+    and ranges are copied out through ctypes, once the first and last rows match what RNA reads.
+    Otherwise the whole array is read once with foreach_get.
+
+    A stream yields between chunks, and the mesh may reallocate its arrays meanwhile (undo, leaving
+    edit mode, a modifier applied...), so the address is looked up and checked again before every read:
+    a changed element count raises ReferenceError, as any mesh gone under a running analysis."""
+
+    def __init__(self, mesh, name, length):
+        self.mesh = mesh
+        self.attribute, self.collection, self.prop, self.width = SOURCES[name]
+        self.length = length
+        self.buffer = np.empty(0, dtype=np.int32)
+        self.whole = None
+        self.pointer = self.find_pointer()
+        if self.pointer is None:
+            self.read_whole()
+
+    def read_whole(self):
+        items = getattr(self.mesh, self.collection)
+        self.whole = np.empty(len(items) * self.width, dtype=np.int32)
+        items.foreach_get(self.prop, self.whole)
+        if self.attribute is None:
+            self.whole = np.append(self.whole, np.int32(len(self.mesh.loops)))
+
+    def find_pointer(self):
+        """Address of the first row, or None when the array cannot be read in place"""
+        if bpy.app.version < (4, 0, 0) or self.length < 2:
+            return None
+        items = getattr(self.mesh, self.collection)
+        try:
+            if self.attribute is None:
+                pointer = items[0].as_pointer()
+            else:
+                pointer = self.mesh.attributes[self.attribute].data[0].as_pointer()
+        except (KeyError, IndexError, AttributeError):
+            return None
+        last = self.length - 1
+        # The face offsets end with the number of corners, one row past the last face
+        if self.attribute is None:
+            expected_last = [len(self.mesh.loops)]
+        else:
+            expected_last = list(np.atleast_1d(getattr(items[last], self.prop)))
+        if self.row(pointer, 0) != list(np.atleast_1d(getattr(items[0], self.prop))) or self.row(pointer, last) != expected_last:
+            return None
+        return pointer
+
+    def revalidate(self):
+        """Look the address up again before a read, the arrays may have moved since the last one"""
+        rows = len(getattr(self.mesh, self.collection)) + (1 if self.attribute is None else 0)
+        if rows != self.length:
+            raise ReferenceError("MeshLint: the mesh changed while it was streamed")
+        self.pointer = self.find_pointer()
+        if self.pointer is None:
+            self.read_whole()
+
+    def row(self, pointer, index):
+        return list((ctypes.c_int32 * self.width).from_address(pointer + index * self.width * 4))
+
+    def read(self, start, stop):
+        """Rows start to stop, valid until the next read"""
+        if self.whole is None:
+            self.revalidate()
+        if self.whole is not None:
+            rows = self.whole[start * self.width:stop * self.width]
+        else:
+            size = (stop - start) * self.width
+            if len(self.buffer) < size:
+                self.buffer = np.empty(size, dtype=np.int32)
+            rows = self.buffer[:size]
+            rows[:] = np.ctypeslib.as_array((ctypes.c_int32 * size).from_address(self.pointer + start * self.width * 4))
+        return rows.reshape(-1, self.width) if self.width > 1 else rows
+
+
+class MeshLintStream:
+    """
+    Analysis of a mesh read chunk by chunk, for meshes too large for a BMesh or a MeshLintArrays
+    snapshot. Arrays are read STREAM_CHUNK rows at a time into reused buffers (MeshLintChunkReader)
+    and flagged elements are set in np.packbits bitsets, in four passes:
+
+      - corners:  number of faces of each edge, saturated at 3, one byte per edge
+      - edges:    valences (saturated above the pole thresholds, at 6 at least) and boundary edge
+                  counts, one byte per vert each, and the nonmanifold edges
+      - faces:    the face-size checks and interior faces; for the nonmanifold verts, each face corner
+                  with its two edges is spilled to a scratch file per range of verts
+      - verts:    the valence checks and nonmanifold verts, the fans around the verts of each range
+                  being counted from its scratch file alone
+
+    The checks with a threshold are answered from the face sizes and saturated valences, whose
+    histograms are kept in histograms (the valence one open-ended at the saturation).
+
+    Memory is bounded by the chunk buffers, the per-range corners of the fan count, one bit per element
+    and check, and one byte per edge and three per vert for the cross-chunk counts, where a BMesh holds
+    hundreds of bytes per element. Results are the same as those of the other engines.
+    """
+
+    def __init__(self, mesh, chunk = STREAM_CHUNK, scratch_dir = None):
+        self.mesh = mesh
+        self.chunk = max(8, chunk - chunk % 8)
+        self.scratch_dir = scratch_dir
+        self.num_verts = len(mesh.vertices)
+        self.num_edges = len(mesh.edges)
+        self.num_faces = len(mesh.polygons)
+        self.num_loops = len(mesh.loops)
+        self.sizes = {'verts' : self.num_verts, 'edges' : self.num_edges, 'faces' : self.num_faces}
+        # Verts per range of the fan count, about a chunk of corners each
+        verts_per_range = self.chunk * self.num_verts // max(self.num_loops, 1)
+        self.range_verts = min(self.chunk, max(8, verts_per_range - verts_per_range % 8))
+
+    def reader(self, name, length):
+        return MeshLintChunkReader(self.mesh, name, length)
+
+    def iter_run(self, lints, histograms = False):
+        """Run the checks, yielding between chunks, and return their flagged elements keyed by symbol:
+        a MeshLintBitset per element type, or a uint32 index array when few elements are flagged.
+        With histograms the valence and face size passes run even when no check needs them."""
+        self.wanted = {lint['symbol'] for lint in lints}
+        unknown = self.wanted - set(FLAGGED)
+        if unknown:
+            raise ValueError(f"MeshLint cannot stream the {', '.join(sorted(unknown))} checks")
+        self.thresholds = {elemtype : [] for elemtype in ('verts', 'faces')}
+        for lint in lints:
+            for elemtype, (low, high) in lint.get('threshold', {}).items():
+                self.thresholds[elemtype].append((lint['symbol'], low, high))
+        bounds = [low for _, low, _ in self.thresholds['verts']]
+        bounds += [high + 1 for _, _, high in self.thresholds['verts'] if high is not None]
+        self.valence_cap = min(255, max([6] + bounds))
+        self.histograms = {}
+        self.bits = {}
+        self.counts = {}
+        for symbol in self.wanted:
+            for elemtype in FLAGGED[symbol]:
+                self.bits[symbol, elemtype] = np.zeros((self.sizes[elemtype] + 7) // 8, dtype=np.uint8)
+                self.counts[symbol, elemtype] = 0
+        self.edge_face_counts = None
+        self.valences = None
+        with tempfile.TemporaryDirectory(prefix='meshlint_', dir=self.scratch_dir) as scratch:
+            self.scratch = scratch
+            if self.wanted & {'interior_faces', 'nonmanifold'}:
+                yield from self.iter_corners()
+            if histograms or self.thresholds['verts'] or 'nonmanifold' in self.wanted:
+                yield from self.iter_edges()
+            if histograms or self.thresholds['faces'] or self.wanted & {'interior_faces', 'nonmanifold'}:
+                yield from self.iter_faces()
+            if self.valences is not None:
+                yield from self.iter_verts()
+        return {symbol : {elemtype : self.result(symbol, elemtype) for elemtype in FLAGGED[symbol]}
+                for symbol in self.wanted}
+
+    def iter_fingerprint(self):
+        """Hash of the topology read chunk by chunk, yielding between chunks: the element counts, the edge
+        verts, the face offsets and the verts and edges of the face corners. Like MeshLintArrays.fingerprint()
+        moving verts keeps it and any change of connectivity changes it, without holding the mesh whole."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array((self.num_verts, self.num_edges, self.num_faces, self.num_loops), dtype=np.int64).tobytes())
+        for name, length in (('edge_verts', self.num_edges), ('face_offsets', self.num_faces + 1),
+                             ('corner_verts', self.num_loops), ('corner_edges', self.num_loops)):
+            reader = self.reader(name, length)
+            for start in range(0, length, self.chunk):
+                digest.update(reader.read(start, min(start + self.chunk, length)).tobytes())
+                yield
+        return digest.hexdigest()
+
+    def flag(self, symbol, elemtype, start, mask):
+        if symbol in self.wanted:
+            set_bits(self.bits[symbol, elemtype], start, mask)
+            self.counts[symbol, elemtype] += int(np.count_nonzero(mask))
+
+    def flag_thresholds(self, elemtype, start, values):
+        """Flag the elements start onwards of the checks with a threshold on their values"""
+        for symbol, low, high in self.thresholds[elemtype]:
+            if high is None:
+                self.flag(symbol, elemtype, start, values >= low)
+            else:
+                self.flag(symbol, elemtype, start, (values >= low) & (values <= high))
+
+    def result(self, symbol, elemtype):
+        bits, count = self.bits[symbol, elemtype], self.counts[symbol, elemtype]
+        if count * 32 > self.sizes[elemtype]:
+            return MeshLintBitset(bits, self.sizes[elemtype], count)
+        indices = np.empty(count, dtype=np.uint32)
+        filled = 0
+        step = self.chunk // 8
+        for first in range(0, len(bits), step):
+            found = np.flatnonzero(np.unpackbits(bits[first:first + step])) + first * 8
+            indices[filled:filled + len(found)] = found
+            filled += len(found)
+        return indices
+
+    # ---------------- passes ----------------
+    def iter_corners(self):
+        """Number of faces of each edge, from the edge of every face corner"""
+        with MeshLintProfiler.stage('stream_corners', self.num_loops):
+            self.edge_face_counts = np.zeros(self.num_edges, dtype=np.uint8)
+            corner_edges = self.reader('corner_edges', self.num_loops)
+            for start in range(0, self.num_loops, self.chunk):
+                accumulate(self.edge_face_counts, corner_edges.read(start, min(start + self.chunk, self.num_loops)), 3)
+                yield
+
+    def iter_edges(self):
+        """Valences and boundary edges of the verts, nonmanifold edges"""
+        with MeshLintProfiler.stage('stream_edges', self.num_edges):
+            self.valences = np.zeros(self.num_verts, dtype=np.uint8)
+            nonmanifold = 'nonmanifold' in self.wanted
+            if nonmanifold:
+                self.boundary_edges = np.zeros(self.num_verts, dtype=np.uint8)
+                self.broken_verts = np.zeros(self.num_verts, dtype=bool)
+            edge_verts = self.reader('edge_verts', self.num_edges)
+            for start in range(0, self.num_edges, self.chunk):
+                stop = min(start + self.chunk, self.num_edges)
+                verts = edge_verts.read(start, stop)
+                accumulate(self.valences, verts.ravel(), self.valence_cap)
+                if nonmanifold:
+                    face_counts = self.edge_face_counts[start:stop]
+                    self.flag('nonmanifold', 'edges', start, face_counts != 2)
+                    accumulate(self.boundary_edges, verts[face_counts == 1].ravel(), 3)
+                    self.broken_verts[verts[(face_counts == 0) | (face_counts > 2)].ravel()] = True
+                yield
+            counts = np.bincount(self.valences, minlength=self.valence_cap + 1)
+            self.histograms['verts'] = MeshLintHistogram(counts, open_ended = True)
+
+    def iter_faces(self):
+        """Face sizes and interior faces, chunks of whole faces of at most a chunk of corners each"""
+        with MeshLintProfiler.stage('stream_faces', self.num_faces):
+            face_sizes = MeshLintHistogram(np.zeros(0, dtype=np.int64))
+            interior = 'interior_faces' in self.wanted
+            fans = 'nonmanifold' in self.wanted
+            face_offsets = self.reader('face_offsets', self.num_faces + 1)
+            if interior or fans:
+                corner_edges = self.reader('corner_edges', self.num_loops)
+            if fans:
+                corner_verts = self.reader('corner_verts', self.num_loops)
+            start = 0
+            while start < self.num_faces:
+                offsets = face_offsets.read(start, min(start + self.chunk, self.num_faces) + 1)
+                count = max(1, int(np.searchsorted(offsets, offsets[0] + self.chunk, side='right')) - 1)
+                sizes = np.diff(offsets[:count + 1])
+                face_sizes = MeshLintHistogram.merge([face_sizes, MeshLintHistogram.of(sizes)])
+                self.flag_thresholds('faces', start, sizes)
+                if interior or fans:
+                    first, last = int(offsets[0]), int(offsets[count])
+                    starts = (offsets[:count] - first).astype(np.int64)
+                    edges = corner_edges.read(first, last)
+                    if interior:
+                        self.flag('interior_faces', 'faces', start,
+                                  np.minimum.reduceat(self.edge_face_counts[edges], starts) >= 3)
+                    if fans:
+                        self.spill_corners(corner_verts.read(first, last), edges, starts, sizes)
+                start += count
+                yield
+            self.histograms['faces'] = face_sizes
+
+    def spill_corners(self, verts, edges, starts, sizes):
+        """Append each corner, with the edges before and after it, to the scratch file of its vert range"""
+        previous = np.arange(-1, len(verts) - 1)
+        previous[starts] = starts + sizes - 1
+        corners = np.stack((verts, edges[previous], edges), axis=1)
+        ranges = verts // self.range_verts
+        order = np.argsort(ranges, kind='stable')
+        ranges, corners = ranges[order], corners[order]
+        bounds = np.concatenate(([0], np.flatnonzero(np.diff(ranges)) + 1, [len(ranges)]))
+        for first, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            with open(self.range_path(int(ranges[first])), 'ab') as scratch:
+                corners[first:stop].tofile(scratch)
+
+    def range_path(self, index):
+        return os.path.join(self.scratch, f"corners_{index}.i32")
+
+    def count_fans(self, index, first, stop):
+        """Number of face fans around the verts first to stop, from the corners spilled for them.
+        The corners of a vert join across each of its edges used by exactly two faces, as count_fans()
+        of MeshLintArrays: sorted by vert and edge, the two corners of such an edge end up side by side."""
+        path = self.range_path(index)
+        if not os.path.exists(path):
+            return np.zeros(stop - first, dtype=np.int64)
+        corners = np.fromfile(path, dtype=np.int32).reshape(-1, 3)
+        os.remove(path)
+        verts = corners[:, 0].astype(np.int64) - first
+        nodes = np.arange(len(corners))
+        keys_verts = np.concatenate((verts, verts))
+        keys_edges = np.concatenate((corners[:, 1], corners[:, 2]))
+        keys_nodes = np.concatenate((nodes, nodes))
+        shared = self.edge_face_counts[keys_edges] == 2
+        keys_verts, keys_edges, keys_nodes = keys_verts[shared], keys_edges[shared], keys_nodes[shared]
+        order = np.lexsort((keys_edges, keys_verts))
+        keys_verts, keys_edges, keys_nodes = keys_verts[order], keys_edges[order], keys_nodes[order]
+        paired = (keys_verts[1:] == keys_verts[:-1]) & (keys_edges[1:] == keys_edges[:-1])
+        labels = connected_labels(len(corners), keys_nodes[:-1][paired], keys_nodes[1:][paired])
+        return np.bincount(verts[labels == nodes], minlength=stop - first)
+
+    def iter_verts(self):
+        """Poles and nonmanifold verts, one vert range at a time"""
+        with MeshLintProfiler.stage('stream_verts', self.num_verts):
+            for index, first in enumerate(range(0, self.num_verts, self.range_verts)):
+                stop = min(first + self.range_verts, self.num_verts)
+                valences = self.valences[first:stop]
+                self.flag_thresholds('verts', first, valences)
+                if 'nonmanifold' in self.wanted:
+                    rejected = (valences == 0) | self.broken_verts[first:stop] | (self.boundary_edges[first:stop] >= 3)
+                    rejected |= self.count_fans(index, first, stop) != 1
+                    self.flag('nonmanifold', 'verts', first, rejected)
+                yield
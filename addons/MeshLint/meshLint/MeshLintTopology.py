@@ -0,0 +1,180 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.utilities import TOPOLOGY_CACHE_SIZE, TOPOLOGY_CACHE_MAX_BYTES
+
+
+def count_edge_faces(loop_edges, num_edges):
+    """Number of faces attached to each edge, one bincount over the edge of every face corner.
+    Like len(edge.link_faces), a face running twice along an edge counts twice."""
+    return np.bincount(loop_edges, minlength=num_edges)
+
+
+def next_loops(loop_starts, face_sizes, num_loops):
+    """Index of the next corner of the same face, for every face corner"""
+    loop_next = np.arange(1, num_loops + 1, dtype=np.int64)
+    loop_next[loop_starts + face_sizes - 1] = loop_starts
+    return loop_next
+
+
+class MeshLintCSR:
+    """One adjacency relation in compressed sparse row form: the targets of source i are
+    indices[offsets[i]:offsets[i + 1]], all stored back to back in one contiguous array."""
+    __slots__ = ('offsets', 'indices')
+
+    def __init__(self, offsets, indices):
+        self.offsets = offsets
+        self.indices = indices
+
+    @classmethod
+    def group(cls, sources, num_sources, targets = None):
+        """Group the targets (by default the positions in sources) by their source, keeping their order"""
+        offsets = np.zeros(num_sources + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_sources), out=offsets[1:])
+        order = np.argsort(sources, kind='stable')
+        return cls(offsets, order if targets is None else targets[order])
+
+    @property
+    def counts(self):
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.indices.nbytes
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, source):
+        return self.indices[self.offsets[source]:self.offsets[source + 1]]
+
+
+class MeshLintTopology:
+    """
+    Adjacency index of a mesh, built from a MeshLintArrays snapshot and shared by the checks that
+    need more than the raw arrays. Each relation is built on first use:
+
+      - valences, edge_face_counts:       element counts, a bincount each
+      - loop_faces, loop_next:            face and next corner of every face corner
+      - vert_edges, vert_loops, vert_faces: CSR relations of each vert
+      - edge_loops, edge_faces:           CSR relations of each edge
+      - face_loops:                       CSR corners of each face (Blender stores them back to back)
+
+    Indices are kept by topology fingerprint in a small LRU: analyzing an unchanged mesh again, or
+    another mesh with the very same topology, reuses the relations already built. The oldest indices
+    are evicted beyond TOPOLOGY_CACHE_SIZE of them or TOPOLOGY_CACHE_MAX_BYTES of arrays, and the
+    object examinations clear it once done (see MeshLintObjectLooper). The cache is
+    guarded by a lock for the worker threads of MeshLintAnalyzer.run_array_checks_all; a relation
+    built twice by two threads at once is the same array either way.
+    """
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def of(cls, arrays):
+        """The topology index of a MeshLintArrays snapshot, from the cache when possible"""
+        key = arrays.fingerprint()
+        with cls._lock:
+            topology = cls._cache.get(key)
+            if topology is None:
+                topology = cls(arrays)
+                cls._cache[key] = topology
+            else:
+                cls._cache.move_to_end(key)
+            cls._trim()
+        return topology
+
+    @classmethod
+    def _trim(cls):
+        """Evict the oldest indices beyond the size caps, the newest one is always kept.
+        Relations are built after an index is cached, so the bytes are counted anew on every call."""
+        nbytes = sum(topology.nbytes for topology in cls._cache.values())
+        while len(cls._cache) > 1 and (len(cls._cache) > TOPOLOGY_CACHE_SIZE or nbytes > TOPOLOGY_CACHE_MAX_BYTES):
+            _, evicted = cls._cache.popitem(last=False)
+            nbytes -= evicted.nbytes
+
+    @classmethod
+    def trim(cls):
+        with cls._lock:
+            cls._trim()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+
+    def __init__(self, arrays):
+        self.num_verts = arrays.num_verts
+        self.num_edges = arrays.num_edges
+        self.num_faces = arrays.num_faces
+        self.num_loops = arrays.num_loops
+        self.edge_verts = arrays.edge_verts
+        self.face_sizes = arrays.face_sizes
+        self.loop_starts = arrays.loop_starts
+        self.loop_verts = arrays.loop_verts
+        self.loop_edges = arrays.loop_edges
+        self._built = {}
+
+    def _lazy(self, name, build):
+        if name not in self._built:
+            self._built[name] = build()
+        return self._built[name]
+
+    @property
+    def nbytes(self):
+        """Bytes of the snapshot arrays this index keeps alive and of the relations built so far"""
+        arrays = (self.edge_verts, self.face_sizes, self.loop_starts, self.loop_verts, self.loop_edges)
+        return sum(array.nbytes for array in arrays) + sum(value.nbytes for value in self._built.values())
+
+    # ---------------- counts ----------------
+    @property
+    def valences(self):
+        """Number of edges attached to each vertex"""
+        return self._lazy('valences', lambda: np.bincount(self.edge_verts.ravel(), minlength=self.num_verts))
+
+    @property
+    def edge_face_counts(self):
+        """Number of faces attached to each edge"""
+        return self._lazy('edge_face_counts', lambda: count_edge_faces(self.loop_edges, self.num_edges))
+
+    # ---------------- face corners ----------------
+    @property
+    def loop_faces(self):
+        return self._lazy('loop_faces', lambda: np.repeat(np.arange(self.num_faces), self.face_sizes))
+
+    @property
+    def loop_next(self):
+        return self._lazy('loop_next', lambda: next_loops(self.loop_starts, self.face_sizes, self.num_loops))
+
+    # ---------------- CSR relations ----------------
+    @property
+    def vert_edges(self):
+        return self._lazy('vert_edges', lambda: MeshLintCSR.group(
+            self.edge_verts.ravel(), self.num_verts, np.arange(self.num_edges * 2) // 2))
+
+    @property
+    def vert_loops(self):
+        return self._lazy('vert_loops', lambda: MeshLintCSR.group(self.loop_verts, self.num_verts))
+
+    @property
+    def vert_faces(self):
+        return self._lazy('vert_faces', lambda: MeshLintCSR(self.vert_loops.offsets, self.loop_faces[self.vert_loops.indices]))
+
+    @property
+    def edge_loops(self):
+        return self._lazy('edge_loops', lambda: MeshLintCSR.group(self.loop_edges, self.num_edges))
+
+    @property
+    def edge_faces(self):
+        return self._lazy('edge_faces', lambda: MeshLintCSR(self.edge_loops.offsets, self.loop_faces[self.edge_loops.indices]))
+
+    @property
+    def face_loops(self):
+        return self._lazy('face_loops', lambda: MeshLintCSR(
+            np.append(self.loop_starts, self.num_loops).astype(np.int64), np.arange(self.num_loops)))
+
+
+def unregister():
+    MeshLintTopology.clear()
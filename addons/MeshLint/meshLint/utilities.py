@@ -1,8 +1,22 @@
+import os
+
 import bpy
 
 # Constants
 
 COMPLAINT_TIMEOUT = 3 # seconds
+MIN_CHECK_INTERVAL = 0.25 # seconds between two continuous checks
+TICK_BUDGET_MS = 8 # milliseconds of analysis per timer tick
+CACHE_MAX_BYTES = 256 * 1024 * 1024 # flagged indices kept by the lint result cache
+TOPOLOGY_CACHE_SIZE = 4 # topology indices kept for meshes analyzed again
+TOPOLOGY_CACHE_MAX_BYTES = 256 * 1024 * 1024 # arrays and relations those indices may hold together
+INCREMENTAL_MAX_SHARE = 0.5 # share of changed edges and faces past which the continuous check reruns everything
+STREAM_CHUNK = 1 << 20 # rows read at a time by the streaming engine
+LINT_THREADS = min(4, os.cpu_count() or 1) # worker threads running the array checks of several meshes
+ARRAY_WINDOW_BYTES = 512 * 1024 * 1024 # topology arrays of several meshes held at once for those threads
+MAX_LISTED_INDICES = 3 # element indices quoted by the continuous check messages
+MAX_CRITICISMS = 10 # object criticisms listed in the side panel
+TOP_OBJECTS = 3 # objects with the most problems listed in the side panel
 ELEM_TYPES = ['verts', 'edges', 'faces']
 
 N_A_STR = '(N/A - disabled)'
@@ -36,6 +50,14 @@ def activate(obj):
 
 # Python Utilities
 
+def exhaust(generator):
+    """Run a generator to its end and hand back its return value"""
+    while True:
+        try:
+            next(generator)
+        except StopIteration as stop:
+            return stop.value
+
 def depluralize(**args):
     """Singular of things is thing, this just knocks off the s at the end of a string."""
     if args['count'] == 1:
@@ -0,0 +1,47 @@
+import bpy
+
+from MeshLint.addons.MeshLint.meshLint.utilities import has_active_mesh, is_edit_mode
+
+
+class MeshLintNewSelector(bpy.types.Operator):
+    """Select only the problems the last continuous check found, and frame them in the viewport"""
+    bl_idname = "meshlint.select_new"
+    bl_label = "MeshLint Select New"
+    bl_options = {'REGISTER', 'UNDO'}
+    text = "Select New Lint"
+
+    frame: bpy.props.BoolProperty(
+        name="Frame",
+        description="Zoom the viewport onto the new problems",
+        default=True,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import MeshLintContinuousChecker
+        new = MeshLintContinuousChecker.new_problems
+        return has_active_mesh(context) and is_edit_mode() and new is not None and new.num_problems() > 0
+
+    def execute(self, context):
+        from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+        from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import MeshLintContinuousChecker
+        new = MeshLintContinuousChecker.new_problems
+        analyzer = MeshLintAnalyzer()
+        if analyzer.element_counts() != new.sizes:
+            self.report({'WARNING'}, "The mesh changed since the last check, wait for the next one")
+            return {'CANCELLED'}
+        analyzer.select_analysis(new)
+        if self.frame:
+            self.frame_selected(context)
+        return {'FINISHED'}
+
+    @staticmethod
+    def frame_selected(context):
+        """Run view_selected in the first 3D viewport, the operator may be called from another area"""
+        for area in context.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            region = next(region for region in area.regions if region.type == 'WINDOW')
+            with context.temp_override(area = area, region = region):
+                bpy.ops.view3d.view_selected()
+            return
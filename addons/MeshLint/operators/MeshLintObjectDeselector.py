@@ -17,7 +17,14 @@ class MeshLintObjectDeselector(MeshLintObjectLooper, bpy.types.Operator):
         return len(selected_meshes) > 1 and not is_edit_mode()
 
     def execute(self, context):
-        if not self.examine_all_selected_meshes():
+        return self.finish_job(context, self.find_all_troubled_meshes())
+
+    def invoke(self, context, event):
+        """From the UI the objects are checked in slices, see MeshLintObjectLooper.start_job()"""
+        return self.start_job(context, self.iter_find_all_troubled_meshes())
+
+    def finish_job(self, context, clean):
+        if not clean:
             self.report({'WARNING'}, "All Lint-free objects are deselected.")
         else:
             self.report({'INFO'}, "All meshes are clean!")
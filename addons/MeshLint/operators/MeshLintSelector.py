@@ -17,16 +17,32 @@ class MeshLintSelector(MeshLintObjectLooper, bpy.types.Operator):
         return has_active_mesh(context)
 
     def execute(self, context):
-        original_mode = bpy.context.mode
         if is_edit_mode():
             self.examine_all_edit_meshes()
         else:
             self.examine_all_selected_meshes()
-            if self.troubled_meshes:
-                ensure_edit_mode()
-            elif not original_mode == 'EDIT_MESH':
-                ensure_not_edit_mode()
+            self.enter_troubled_meshes()
         return {"FINISHED"}
 
+    def invoke(self, context, event):
+        """From the UI the objects are checked in slices, see MeshLintObjectLooper.start_job()"""
+        self.was_edit_mode = is_edit_mode()
+        if self.was_edit_mode:
+            return self.start_job(context, self.iter_examine_all_edit_meshes())
+        return self.start_job(context, self.iter_examine_all_selected_meshes())
+
+    def finish_job(self, context, result):
+        if not self.was_edit_mode:
+            self.enter_troubled_meshes()
+        return {"FINISHED"}
+
+    def enter_troubled_meshes(self):
+        """Select the problems of the troubled meshes and edit them, stay in object mode if all are clean"""
+        if self.troubled_meshes:
+            self.select_troubled_elements()
+            ensure_edit_mode()
+        else:
+            ensure_not_edit_mode()
+
 
 
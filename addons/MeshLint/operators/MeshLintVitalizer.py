@@ -1,6 +1,6 @@
 import bpy
 
-from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import meshlint_gbl_continuous_check
+from MeshLint.addons.MeshLint.meshLint.MeshLintScheduler import MeshLintScheduler
 from MeshLint.addons.MeshLint.meshLint.utilities import has_active_mesh, is_edit_mode
 
 
@@ -19,8 +19,11 @@ class MeshLintVitalizer(bpy.types.Operator):
         return has_active_mesh(context) and is_edit_mode()
 
     def execute(self, context):
+        # The continuous checker pulls in the analysis modules, only wanted once the checking starts
+        from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import meshlint_gbl_continuous_check
         if MeshLintVitalizer.is_live:
             bpy.app.handlers.depsgraph_update_post.remove(meshlint_gbl_continuous_check)
+            MeshLintScheduler.cancel()
             MeshLintVitalizer.is_live = False
             MeshLintVitalizer.text = 'Continuous Check!'
             MeshLintVitalizer.play_pause = 'PLAY'
@@ -1,14 +1,25 @@
+import sys
+
 import bpy
-import re
 
-from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
-from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
-from MeshLint.addons.MeshLint.meshLint.utilities import has_active_mesh, TBD_STR, N_A_STR, depluralize
+from MeshLint.addons.MeshLint import check_keywords
+from MeshLint.addons.MeshLint.meshLint.MeshLintCriticism import MeshLintCriticism
+from MeshLint.addons.MeshLint.meshLint.MeshLintObjectLooper import MeshLintObjectLooper
+from MeshLint.addons.MeshLint.meshLint.MeshLintProfiler import MeshLintProfiler
+from MeshLint.addons.MeshLint.meshLint.MeshLintScheduler import MeshLintScheduler
+from MeshLint.addons.MeshLint.meshLint.utilities import has_active_mesh, TBD_STR, N_A_STR, depluralize, TOP_OBJECTS
+from MeshLint.addons.MeshLint.operators.MeshLintNewSelector import MeshLintNewSelector
 from MeshLint.addons.MeshLint.operators.MeshLintObjectDeselector import MeshLintObjectDeselector
 from MeshLint.addons.MeshLint.operators.MeshLintSelector import MeshLintSelector
 from MeshLint.addons.MeshLint.operators.MeshLintVitalizer import MeshLintVitalizer
 from MeshLint.common.types.framework import reg_order
 
+
+def checked_store():
+    """The MeshLintStore, or None while nothing was checked: its module, and NumPy with it, is imported by the checks"""
+    store = sys.modules.get('MeshLint.addons.MeshLint.meshLint.MeshLintStore')
+    return store.MeshLintStore() if store is not None else None
+
 class BasePanel:
     # bl_space_type = 'PROPERTIES'
     # bl_region_type = 'WINDOW'
@@ -32,10 +43,19 @@ class MeshLintControlPanel(BasePanel, bpy.types.Panel):
         [ The buttons ]
         [ The report result aka criticism ]
         [ The lint tick boxes for test options to enable ]
+        The analysis modules are imported by the checks, not at registration or to draw the panel.
         """
         layout = self.layout
         self.add_main_buttons(layout)
+        if MeshLintObjectLooper.progress is not None:
+            self.add_progress(layout)
+        if MeshLintVitalizer.is_live:
+            self.add_live_stats(layout, context)
+        if context.scene.meshlint_profile:
+            self.add_profile_stats(layout)
         self.add_criticism(layout, context)
+        if context.scene.meshlint_histograms:
+            self.add_histograms(layout, context)
         self.add_toggle_buttons(layout, context)
 
     @staticmethod
@@ -51,6 +71,47 @@ class MeshLintControlPanel(BasePanel, bpy.types.Panel):
         right.operator(MeshLintVitalizer.bl_idname, text = MeshLintVitalizer.text, icon = MeshLintVitalizer.play_pause)
         layout.split().operator(MeshLintObjectDeselector.bl_idname, text = MeshLintObjectDeselector.text, icon = "UV_ISLANDSEL")
 
+    @staticmethod
+    def add_progress(layout):
+        """Show how far the running Select Lint or Deselect is"""
+        done, total = MeshLintObjectLooper.progress
+        layout.column().row().label(text = f"Checked {done}/{total} objects... (Esc to cancel)", icon = 'SORTTIME')
+
+    @staticmethod
+    def add_live_stats(layout, context):
+        """Show the scheduler settings and how well the continuous check keeps up"""
+        from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import MeshLintContinuousChecker
+        col = layout.column()
+        row = col.row()
+        row.prop(context.scene, 'meshlint_min_interval', text='Interval')
+        row.prop(context.scene, 'meshlint_tick_budget', text='Budget (ms)')
+        stats = MeshLintScheduler.stats()
+        if stats['latency'] is not None:
+            col.row().label(text = f"Latency {stats['latency'] * 1000:.0f} ms, {stats['slices']} slices, "
+                                   f"{stats['dropped']} dropped", icon = 'TIME')
+        if MeshLintContinuousChecker.fingerprint_seconds is not None:
+            col.row().label(text = f"Topology fingerprint {MeshLintContinuousChecker.fingerprint_seconds * 1000:.1f} ms",
+                            icon = 'CHECKMARK')
+        new = MeshLintContinuousChecker.new_problems
+        resolved = MeshLintContinuousChecker.resolved_problems
+        if new is not None:
+            col.row().label(text = f"{new.num_problems()} new, {resolved.num_problems()} resolved since last check",
+                            icon = 'ZOOM_SELECTED')
+            col.row().operator(MeshLintNewSelector.bl_idname, text = MeshLintNewSelector.text, icon = "RESTRICT_SELECT_OFF")
+
+    @staticmethod
+    def add_profile_stats(layout):
+        """Show the latest time and throughput of each profiled stage, slowest first"""
+        col = layout.column()
+        latest = MeshLintProfiler.stats()['latest']
+        if not latest:
+            col.row().label(text = "Run a check to profile it", icon = 'TIME')
+        for entry in latest:
+            label = f"{entry['stage']}: {entry['seconds'] * 1000:.2f} ms"
+            if entry['per_second']:
+                label += f", {entry['per_second'] / 1e6:.2f} M elements/s"
+            col.row().label(text = label, icon = 'TIME')
+
     @staticmethod
     def add_criticism(layout, context):
         """Build the lint numerical result for each test"""
@@ -58,8 +119,8 @@ class MeshLintControlPanel(BasePanel, bpy.types.Panel):
         if not has_active_mesh(context):
             return
         total_problems = 0
-        store = MeshLintStore()
-        for lint in store.results:
+        store = checked_store()
+        for lint in store.results if store is not None else []:
             count = lint['count']
             if count in (TBD_STR, N_A_STR):
                 label = str(count) + ' ' + f"{lint['label']}"
@@ -73,81 +134,67 @@ class MeshLintControlPanel(BasePanel, bpy.types.Panel):
                 label = depluralize(count = count, string = label)
                 reward = 'ERROR'
             col.row().label(text = label, icon = reward)
-        name_crits = MeshLintControlPanel.build_object_criticism(bpy.context.selected_objects, total_problems)
-        for crit in name_crits:
+        top_objects = store.top_objects(TOP_OBJECTS) if store is not None else []
+        if len(top_objects) > 1:
+            col.row().label(text = 'Most problems:')
+            for name, count in top_objects:
+                col.row().label(text = f'"{name}": {count}', icon = 'OBJECT_DATA')
+        for crit in MeshLintCriticism.lines(context, total_problems):
             col.row().label(text = crit)
 
+    @staticmethod
+    def add_histograms(layout, context):
+        """Show the vertex valences and face sizes of the checked objects, a row per value,
+        the values flagged by an enabled check marked"""
+        store = checked_store()
+        histograms = store.histograms() if store is not None else {}
+        col = layout.column()
+        if not histograms:
+            col.row().label(text = "Run a check to fill the histograms", icon = 'SORTSIZE')
+            return
+        from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+        # The (low, high) ranges of the enabled checks flagging values of the histograms
+        ranges = [(elemtype, low, high) for lint in MeshLintAnalyzer.CHECKS
+                  if 'threshold' in lint and getattr(context.scene, lint['check_prop'])
+                  for elemtype, (low, high) in lint['threshold'].items()]
+        for elemtype, title, unit in (('verts', "Vertex valences:", 'edges'), ('faces', "Face sizes:", 'sides')):
+            if elemtype not in histograms:
+                continue
+            col.row().label(text = title)
+            histogram = histograms[elemtype]
+            last = len(histogram.counts) - 1
+            for value, count in histogram.bins():
+                flagged = any(flagged_type == elemtype and low <= value and (high is None or value <= high)
+                              for flagged_type, low, high in ranges)
+                plus = '+' if histogram.open_ended and value == last else ''
+                col.row().label(text = f"{value}{plus} {unit}: {count}", icon = 'ERROR' if flagged else 'BLANK1')
+
     @staticmethod
     def add_toggle_buttons(layout, context):
         """Build the tick boxes for the GUI"""
         col = layout.column()
         col.row().label(text = "MeshLint rules to include:")
-        for lint in MeshLintAnalyzer.CHECKS:
-            prop_name = lint['check_prop']
-            label = 'Check ' + f"{lint['label']}"
+        # The labels come with the property keywords, the analyzer is not imported to list the checks
+        for prop_name, keywords in check_keywords().items():
+            label = 'Check ' + f"{keywords['name']}"
             col.row().prop(context.scene, prop_name, text=label)
+        col.row().prop(context.scene, 'meshlint_engine', text='Engine')
+        col.row().prop(context.scene, 'meshlint_incremental', text='Incremental Continuous Check')
+        col.row().prop(context.scene, 'meshlint_histograms', text='Valence and Face Size Histograms')
+        col.row().prop(context.scene, 'meshlint_profile', text='Profile Lint Stages')
 
     @staticmethod
     def build_object_criticism(objects, total_problems):
         """Generate the criticism text for the side panel"""
-        already_complained = total_problems > 0
-        criticisms = []
-
-        def add_crit(crit):
-            if already_complained:
-                conjunction = "and also"
-            else:
-                conjunction = "but"
-            criticisms.append(f'...{conjunction} "{obj.name}" {crit}.')
-
-        for obj in objects:
-            if MeshLintControlPanel.has_unapplied_scale(obj.scale):
-                add_crit('has an unapplied scale')
-                already_complained = True
-            if MeshLintControlPanel.is_bad_name(obj.name):
-                add_crit('is not a great name')
-                already_complained = True
-
-        return criticisms
+        return MeshLintCriticism.render(MeshLintCriticism.find(objects), total_problems)
 
     @staticmethod
     def has_unapplied_scale(scale):
         """Where an object has no outstanding scale to be applied the values will be 1.0.
         This Looks at the scale of an object and determines if it is ==1.0."""
-        return len([c for c in scale if c == 1.0]) != 3
+        return MeshLintCriticism.has_unapplied_scale(scale)
 
     @staticmethod
     def is_bad_name(name):
         """A list of names that are default."""
-        default_names = [
-            'BezierCircle',
-            'BezierCurve',
-            'Circle',
-            'Cone',
-            'Cube',
-            'CurvePath',
-            'Cylinder',
-            'Grid',
-            'Icosphere',
-            'Mball',
-            'Monkey',
-            'NurbsCircle',
-            'NurbsCurve',
-            'NurbsPath',
-            'Plane',
-            'Sphere',
-            'Surface',
-            'SurfCircle',
-            'SurfCurve',
-            'SurfCylinder',
-            'SurfPatch',
-            'SurfSphere',
-            'SurfTorus',
-            'Text',
-            'Torus',
-        ]
-        pat = rf"{'|'.join(default_names)}\.?\d*$"
-        return re.match(pat, name) is not None
-
-
-
+        return MeshLintCriticism.is_bad_name(name)
@@ -0,0 +1,38 @@
+"""Registration manifest of the add-on: register() imports these modules and registers these classes instead of
+searching every module at startup. Generated by scripts/meshlint_manifest.py, do not edit."""
+
+MODULES = [
+    'addons.MeshLint.meshLint.MeshLintCache',
+    'addons.MeshLint.meshLint.MeshLintCriticism',
+    'addons.MeshLint.meshLint.MeshLintProfiler',
+    'addons.MeshLint.operators.MeshLintNewSelector',
+    'addons.MeshLint.operators.MeshLintObjectDeselector',
+    'addons.MeshLint.operators.MeshLintSelector',
+    'addons.MeshLint.operators.MeshLintVitalizer',
+    'addons.MeshLint.panels.MeshLintControl',
+]
+
+CLASSES = [
+    ('addons.MeshLint.panels.MeshLintControl', 'MeshLintControlPanel'),
+    ('addons.MeshLint.operators.MeshLintNewSelector', 'MeshLintNewSelector'),
+    ('addons.MeshLint.operators.MeshLintObjectDeselector', 'MeshLintObjectDeselector'),
+    ('addons.MeshLint.operators.MeshLintSelector', 'MeshLintSelector'),
+    ('addons.MeshLint.operators.MeshLintVitalizer', 'MeshLintVitalizer'),
+]
+
+FRAMEWORK_CLASSES = []
+
+LAZY_MODULES = [
+    'addons.MeshLint.meshLint.MeshLintScheduler',
+    'addons.MeshLint.meshLint.MeshLintTopology',
+]
+
+CHECK_PROPERTIES = {
+    'meshlint_check_tris': {'name': 'Tris', 'default': True, 'description': 'A face with 3 edges. Often bad for modelling because it stops edge loops and does not deform well around bent areas. A mesh might look good until you animate, so beware!'},
+    'meshlint_check_ngons': {'name': 'Ngons', 'default': True, 'description': 'A face with >4 edges. Is generally bad in exactly the same way as Tris'},
+    'meshlint_check_nonmanifold': {'name': 'Nonmanifold Elements', 'default': True, 'description': "Simply, shapes that won't hold water. More precisely, non-manifold edges are those that do not have exactly 2 faces attached to them (either more or less). Non-manifold verts are more complicated -- you can see their definition in BM_vert_is_manifold() in bmesh_queries.c"},
+    'meshlint_check_interior_faces': {'name': 'Interior Faces', 'default': True, 'description': "This confuses people. It is very specific: A face whose edges ALL have >2 faces attached. The simplest way to see this is to Ctrl+r a Default Cube and hit 'f'"},
+    'meshlint_check_three_poles': {'name': '3-edge Poles', 'default': False, 'description': 'A vertex with 3 edges connected to it. Also known as an N-Pole'},
+    'meshlint_check_five_poles': {'name': '5-edge Poles', 'default': False, 'description': 'A vertex with 5 edges connected to it. Also known as an E-Pole'},
+    'meshlint_check_sixplus_poles': {'name': '6+-edge Poles', 'default': False, 'description': 'A vertex with 6 or more edges connected to it. Generally this is not something you want, but since some kinds of extrusions will legitimately cause such a pole (imagine extruding each face of a Cube outward, the inner corners are rightful 6+-poles). Still, if you do not know for sure that you want them, i wart is good to enable this '},
+}
@@ -0,0 +1,211 @@
+"""Time the MeshLint checks on synthetic meshes of 1k to 10M faces and write the timings as JSON:
+
+    blender -b --factory-startup --python benchmarks/meshlint_bench.py -- [-o bench.json] [--max-faces 1000000]
+        [--kinds grid,defects] [--repeat 3] [--compare baseline.json] [--tolerance 1.25]
+
+Each record holds the mesh kind and size, the stage that was timed and its best and median seconds.
+With --compare every stage is matched with the same stage of an earlier result file, and the exit
+code is 1 when one of them got slower than tolerance times its baseline.
+
+The add-on folder has to be named MeshLint, as it is once installed.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Make the MeshLint package and the mesh builders importable without installing the add-on
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bpy
+import numpy as np
+
+from MeshLint.addons.MeshLint import _addon_properties, check_properties
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalysis import MeshLintHistogram
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import MeshLintArrays
+from MeshLint.addons.MeshLint.meshLint.MeshLintContinuousChecker import MeshLintContinuousChecker
+from MeshLint.addons.MeshLint.meshLint.MeshLintStore import MeshLintStore
+from MeshLint.addons.MeshLint.meshLint.utilities import ELEM_TYPES
+from MeshLint.common.class_loader.auto_load import add_properties
+from synthetic_meshes import KINDS, link_object, remove_object
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+ENGINES = ['BMESH', 'NUMPY', 'STREAM']
+STORE_OBJECTS = 100  # add_counts calls per timing, as for a selection of that many objects
+
+
+def timed(function, repeat, setup = None):
+    """Best and median seconds of repeat calls of function, setup runs untimed before each call"""
+    seconds = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - started)
+    return {'best' : min(seconds), 'median' : statistics.median(seconds), 'repeat' : repeat}
+
+
+def find_problems(obj, engine):
+    analyzer = MeshLintAnalyzer(obj = obj, engine = engine, edit_mode = False)
+    analysis = analyzer.find_problems()
+    analyzer.free()
+    return analysis
+
+
+def copy_bmesh(obj):
+    analyzer = MeshLintAnalyzer(obj = obj, engine = 'BMESH', edit_mode = False)
+    analyzer.b  # Built on first use
+    analyzer.free()
+
+
+def bench_object(obj, repeat):
+    """Yield (stage, timing) for every measured stage on one mesh object"""
+    mesh = obj.data
+    yield 'MeshLintArrays', timed(lambda: MeshLintArrays(mesh), repeat)
+    arrays = MeshLintArrays(mesh)
+    yield 'numpy.histograms', timed(lambda: (MeshLintHistogram.of(arrays.valences), MeshLintHistogram.of(arrays.face_sizes)), repeat)
+    for lint in MeshLintAnalyzer.CHECKS:
+        yield 'numpy.check_' + f"{lint['symbol']}", timed(lambda: MeshLintAnalyzer.run_array_check(arrays, lint), repeat)
+
+    yield 'bmesh.from_mesh', timed(lambda: copy_bmesh(obj), repeat)
+    # The check_ methods follow the engine of the analyzer: with BMESH each one is a fused pass over the BMesh
+    analyzer = MeshLintAnalyzer(obj = obj, engine = 'BMESH', edit_mode = False)
+    for lint in MeshLintAnalyzer.CHECKS:
+        yield 'bmesh.check_' + f"{lint['symbol']}", timed(getattr(analyzer, 'check_' + f"{lint['symbol']}"), repeat)
+
+    for engine in ENGINES:
+        yield f"find_problems[{engine}]", timed(lambda: find_problems(obj, engine), repeat)
+
+    flagged = MeshLintAnalyzer.flagged_indices(find_problems(obj, 'NUMPY'))
+    flagged = {elemtype : flagged[elemtype].tolist() for elemtype in ELEM_TYPES}
+
+    def select_flagged():
+        for elemtype in reversed(ELEM_TYPES):
+            analyzer.select_indices(elemtype, flagged[elemtype])
+    yield 'select_indices', timed(select_flagged, repeat)
+    analyzer.free()
+
+    checks = [dict(lint) for lint in MeshLintAnalyzer.CHECKS]
+    store = MeshLintStore()
+
+    def add_counts():
+        for _ in range(STORE_OBJECTS):
+            store.add_counts(checks)
+    yield f"MeshLintStore.add_counts[x{STORE_OBJECTS}]", timed(add_counts, repeat, setup = store.clear)
+    store.clear()
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        for engine in ENGINES:
+            bpy.context.scene.meshlint_engine = engine
+
+            def forget_analysis():
+                MeshLintContinuousChecker.previous_fingerprint = None
+                MeshLintContinuousChecker.previous_analysis = None
+            yield f"continuous_tick[{engine}]", timed(MeshLintContinuousChecker.check, repeat, setup = forget_analysis)
+            # The key of the tick does not hold the engine: make sure the timing is of a full re-lint
+            if MeshLintContinuousChecker.previous_analysis is None:
+                raise RuntimeError(f"continuous_tick[{engine}] did not run the analysis")
+        # Nothing changed since the last tick: the mesh is written back and fingerprinted, but not checked
+        analysis = MeshLintContinuousChecker.previous_analysis
+        yield 'continuous_tick[unchanged]', timed(MeshLintContinuousChecker.check, repeat)
+        if MeshLintContinuousChecker.previous_analysis is not analysis:
+            raise RuntimeError("continuous_tick[unchanged] ran the analysis of an unchanged mesh")
+    finally:
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def run(sizes, kinds, repeat, log = sys.stderr):
+    """Build every mesh kind at every size, time all the stages and return the JSON document"""
+    if not hasattr(bpy.types.Scene, 'meshlint_engine'):
+        add_properties(_addon_properties)
+        add_properties({bpy.types.Scene : check_properties()})
+    for lint in MeshLintAnalyzer.CHECKS:
+        setattr(bpy.context.scene, f"{lint['check_prop']}", True)
+    records = []
+    for size in sizes:
+        for kind in kinds:
+            started = time.perf_counter()
+            mesh = KINDS[kind](size)
+            built = time.perf_counter() - started
+            obj = link_object(mesh)
+            base = {
+                'kind' : kind,
+                'target_faces' : size,
+                'faces' : len(mesh.polygons),
+                'edges' : len(mesh.edges),
+                'verts' : len(mesh.vertices),
+            }
+            records.append(dict(base, stage = 'build', best = built, median = built, repeat = 1))
+            for stage, timing in bench_object(obj, repeat):
+                records.append(dict(base, stage = stage, **timing))
+                log.write(f"{kind:>8} {size:>10} {stage:<36} {timing['best'] * 1000:10.2f} ms\n")
+            remove_object(obj)
+    return {
+        'blender' : bpy.app.version_string,
+        'python' : platform.python_version(),
+        'numpy' : np.__version__,
+        'machine' : platform.machine(),
+        'records' : records,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Return a line for every stage that got slower than tolerance times its baseline best time"""
+    before = {(record['kind'], record['target_faces'], record['stage']) : record['best'] for record in baseline['records']}
+    regressions = []
+    for record in result['records']:
+        key = (record['kind'], record['target_faces'], record['stage'])
+        if record['stage'] == 'build' or key not in before or before[key] <= 0:
+            continue
+        ratio = record['best'] / before[key]
+        if ratio > tolerance:
+            regressions.append(f"{key[0]} {key[1]} {key[2]}: {before[key] * 1000:.2f} ms -> "
+                               f"{record['best'] * 1000:.2f} ms (x{ratio:.2f})")
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='blender -b --python meshlint_bench.py --',
+        description='Time the MeshLint checks on synthetic meshes and write the timings as JSON.')
+    parser.add_argument('-o', '--output', help='result file, standard output when omitted')
+    parser.add_argument('--max-faces', type=int, default=SIZES[-1], help='skip the sizes above this face count')
+    parser.add_argument('--kinds', default=','.join(KINDS), help=f"comma separated mesh kinds among {', '.join(KINDS)}")
+    parser.add_argument('--repeat', type=int, default=3, help='timed calls per stage, the best one is kept')
+    parser.add_argument('--compare', help='earlier result file to check this run against')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='slowdown ratio reported as a regression')
+    args = parser.parse_args(argv)
+    unknown = [kind for kind in args.kinds.split(',') if kind not in KINDS]
+    if unknown:
+        parser.error(f"unknown mesh kinds {', '.join(unknown)}, choose from {', '.join(KINDS)}")
+    return args
+
+
+def main(argv = None):
+    """Entry point of the benchmark, returns 1 when --compare found a regression"""
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = parse_args(argv)
+    result = run([size for size in SIZES if size <= args.max_faces], args.kinds.split(','), args.repeat)
+    text = json.dumps(result, indent=1)
+    if args.output:
+        Path(args.output).write_text(text, encoding='utf-8')
+    else:
+        sys.stdout.write(text + '\n')
+    if args.compare:
+        regressions = compare(result, json.loads(Path(args.compare).read_text(encoding='utf-8')), args.tolerance)
+        for line in regressions:
+            sys.stderr.write('Regression: ' + line + '\n')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
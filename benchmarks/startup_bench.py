@@ -0,0 +1,136 @@
+"""Measure what enabling the add-on adds to the start of Blender, with and without the registration manifest:
+
+    blender -b --factory-startup --python benchmarks/startup_bench.py -- [-o startup.json] [--repeat 10]
+    python benchmarks/startup_bench.py -- [-o startup.json] [--repeat 10]     (with the bpy module)
+
+Every sample is a new Blender process. In 'blender' the add-on is not loaded at all, in 'manifest' it is
+imported and registered from registration_manifest, in 'discover' every module is imported and searched
+as without the manifest (MESHLINT_DISCOVER=1). Each record holds the best and median seconds of the
+import, of register() and of the whole process, how many MeshLint modules register() left imported, and
+whether NumPy was imported by then: either newly, or by a MeshLint module when Blender had imported it
+already (the bpy module of Blender 5 does).
+
+The add-on folder has to be named MeshLint, as it is once installed.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+MODES = ['blender', 'manifest', 'discover']
+RESULT_PREFIX = 'MESHLINT_STARTUP '
+
+
+def numpy_modules():
+    """The imported MeshLint modules holding a reference to NumPy"""
+    numpy = sys.modules.get('numpy')
+    if numpy is None:
+        return []
+    return sorted(name for name, module in list(sys.modules.items())
+                  if name.startswith('MeshLint') and module is not None and numpy in vars(module).values())
+
+
+def measure(mode):
+    """In a child Blender: import and register the add-on as mode does, print the timings on one line"""
+    numpy_before = 'numpy' in sys.modules
+    timings = {'import' : 0.0, 'register' : 0.0}
+    if mode != 'blender':
+        # Make the MeshLint package importable without installing the add-on
+        sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+        started = time.perf_counter()
+        import MeshLint
+        imported = time.perf_counter()
+        MeshLint.register()
+        timings = {'import' : imported - started, 'register' : time.perf_counter() - imported}
+    users = numpy_modules()
+    numpy_loaded = ('numpy' in sys.modules and not numpy_before) or bool(users)
+    modules = sum(1 for name in sys.modules if name.startswith('MeshLint'))
+    if mode != 'blender':
+        MeshLint.unregister()
+    print(RESULT_PREFIX + json.dumps(dict(timings, numpy = numpy_loaded, numpy_modules = users, modules = modules)),
+          flush = True)
+
+
+def sample(mode):
+    """Start a child Blender measuring mode, return its timings and the seconds the whole process took"""
+    if bpy.app.binary_path:
+        command = [bpy.app.binary_path, '-b', '--factory-startup', '--python', str(Path(__file__).resolve()), '--']
+    else:
+        # The bpy module has no Blender binary: the child is a Python importing it
+        command = [sys.executable, str(Path(__file__).resolve()), '--']
+    command += ['--child', mode]
+    environment = dict(os.environ)
+    environment.pop('MESHLINT_DISCOVER', None)
+    if mode == 'discover':
+        environment['MESHLINT_DISCOVER'] = '1'
+    started = time.perf_counter()
+    output = subprocess.run(command, env = environment, capture_output = True, text = True, check = True).stdout
+    seconds = time.perf_counter() - started
+    line = next(line for line in output.splitlines() if line.startswith(RESULT_PREFIX))
+    return dict(json.loads(line[len(RESULT_PREFIX):]), process = seconds)
+
+
+def run(repeat, log = sys.stderr):
+    """Sample every mode repeat times, interleaved so that a slower moment of the machine hits them all"""
+    samples = {mode : [] for mode in MODES}
+    for _ in range(repeat):
+        for mode in MODES:
+            samples[mode].append(sample(mode))
+    records = []
+    for mode in MODES:
+        record = {
+            'mode' : mode,
+            'repeat' : repeat,
+            'numpy' : any(entry['numpy'] for entry in samples[mode]),
+            'numpy_modules' : sorted({name for entry in samples[mode] for name in entry['numpy_modules']}),
+            'modules' : max(entry['modules'] for entry in samples[mode]),
+        }
+        for stage in ('import', 'register', 'process'):
+            seconds = [entry[stage] for entry in samples[mode]]
+            record[stage] = {'best' : min(seconds), 'median' : statistics.median(seconds)}
+        records.append(record)
+        log.write(f"{mode:>8}  import {record['import']['median'] * 1000:8.2f} ms  register "
+                  f"{record['register']['median'] * 1000:8.2f} ms  process {record['process']['median'] * 1000:8.1f} ms"
+                  f"  {record['modules']:3d} modules{'  (imports NumPy)' if record['numpy'] else ''}\n")
+    return {
+        'blender' : bpy.app.version_string,
+        'python' : platform.python_version(),
+        'machine' : platform.machine(),
+        'records' : records,
+    }
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='blender -b --factory-startup --python startup_bench.py --',
+        description='Measure the startup cost of the MeshLint add-on with and without its registration manifest.')
+    parser.add_argument('-o', '--output', help='result file, standard output when omitted')
+    parser.add_argument('--repeat', type=int, default=10, help='Blender processes started per mode')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv = None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = parse_args(argv)
+    if args.child:
+        measure(args.child)
+        return 0
+    text = json.dumps(run(args.repeat), indent=1)
+    if args.output:
+        Path(args.output).write_text(text, encoding='utf-8')
+    else:
+        sys.stdout.write(text + '\n')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
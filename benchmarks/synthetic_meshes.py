@@ -0,0 +1,118 @@
+"""Deterministic synthetic meshes for the MeshLint benchmarks.
+
+Every builder takes a target face count and returns a mesh datablock with about that many faces.
+Grids are built from NumPy arrays with foreach_set so that even 10M faces are made in seconds,
+the cube goes through bmesh.ops:
+
+  - grid:    a flat quad grid, only its border is flagged (nonmanifold edges, 3-poles at the corners)
+  - cube:    a closed subdivided cube, clean except for the 3-poles at its corners
+  - defects: a quad grid where pairs of quads are turned into tris, ngons or duplicated faces
+             (interior faces), plus loose verts and wire edges (nonmanifold); the diagonals of the
+             tris and the merged edges of the ngons leave 5-poles, 6-poles and 3-poles behind
+"""
+import bmesh
+import bpy
+import numpy as np
+
+DEFECT_RATE = 0.01  # share of quad pairs turned into each kind of defect
+
+
+def quad_grid(n_faces):
+    """Vertex coordinates and quads (side, side, 4) of a square grid of about n_faces quads"""
+    side = max(1, int(round(np.sqrt(n_faces))))
+    x, y = np.meshgrid(np.arange(side + 1, dtype=np.float32), np.arange(side + 1, dtype=np.float32))
+    coords = np.stack((x.ravel(), y.ravel(), np.zeros(x.size, dtype=np.float32)), axis=1)
+    v0 = (np.arange(side)[:, None] * (side + 1) + np.arange(side)[None, :]).astype(np.int32)
+    quads = np.stack((v0, v0 + 1, v0 + side + 2, v0 + side + 1), axis=2)
+    return coords, quads
+
+
+def build_mesh(name, coords, faces, wire_edges = None):
+    """Make a mesh datablock from coordinates and a list of (F, n) face arrays of any sizes"""
+    face_sizes = np.concatenate([np.full(len(block), block.shape[1], dtype=np.int32) for block in faces])
+    loop_verts = np.concatenate([block.ravel() for block in faces]).astype(np.int32)
+    loop_starts = np.zeros(len(face_sizes), dtype=np.int32)
+    np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', coords.astype(np.float32).ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set('vertex_index', loop_verts)
+    mesh.polygons.add(len(face_sizes))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+    mesh.update(calc_edges=True)
+    if wire_edges is not None and len(wire_edges):
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        mesh.edges.add(len(wire_edges))
+        mesh.edges.foreach_set('vertices', np.concatenate((edge_verts, wire_edges.astype(np.int32).ravel())))
+        mesh.update()
+    return mesh
+
+
+def make_grid(n_faces, seed = 0):
+    coords, quads = quad_grid(n_faces)
+    return build_mesh(f"grid_{n_faces}", coords, [quads.reshape(-1, 4)])
+
+
+def make_cube(n_faces, seed = 0):
+    cuts = max(0, int(round(np.sqrt(n_faces / 6))) - 1)
+    b = bmesh.new()
+    bmesh.ops.create_cube(b, size=2.0)
+    if cuts:
+        bmesh.ops.subdivide_edges(b, edges=b.edges[:], cuts=cuts, use_grid_fill=True)
+    mesh = bpy.data.meshes.new(f"cube_{n_faces}")
+    b.to_mesh(mesh)
+    b.free()
+    return mesh
+
+
+def make_defects(n_faces, seed = 0):
+    coords, quads = quad_grid(n_faces)
+    side = quads.shape[0]
+    even = side - side % 2
+    pairs = quads[:, :even].reshape(side, even // 2, 2, 4).reshape(-1, 2, 4)
+    rest = quads[:, even:].reshape(-1, 4)
+    rng = np.random.default_rng(seed)
+    kind = rng.choice(4, size=len(pairs), p=[1 - 3 * DEFECT_RATE, DEFECT_RATE, DEFECT_RATE, DEFECT_RATE])
+
+    split = pairs[kind == 1].reshape(-1, 4)
+    tris = np.stack((split[:, [0, 1, 2]], split[:, [0, 2, 3]]), axis=1).reshape(-1, 3)
+    merged = pairs[kind == 2]
+    ngons = np.stack((merged[:, 0, 0], merged[:, 1, 0], merged[:, 1, 1],
+                      merged[:, 1, 2], merged[:, 0, 2], merged[:, 0, 3]), axis=1)
+    doubled = pairs[kind == 3].reshape(-1, 4)
+    quads = np.concatenate((pairs[(kind == 0) | (kind == 3)].reshape(-1, 4), rest, doubled))
+
+    num_loose = max(4, int(len(coords) * DEFECT_RATE)) // 4 * 4
+    loose = rng.random((num_loose, 3), dtype=np.float32) * side
+    loose[:, 2] += 1.0
+    first_loose = len(coords)
+    # Half of the extra verts stay loose, the other half is joined by wire edges
+    wire_edges = first_loose + num_loose // 2 + np.arange(num_loose // 2).reshape(-1, 2)
+    return build_mesh(f"defects_{n_faces}", np.concatenate((coords, loose)), [quads, tris, ngons], wire_edges)
+
+
+KINDS = {
+    'grid' : make_grid,
+    'cube' : make_cube,
+    'defects' : make_defects,
+}
+
+
+def link_object(mesh):
+    """Put the mesh in the scene as the only selected and active object"""
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    for other in bpy.context.view_layer.objects:
+        other.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+def remove_object(obj):
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
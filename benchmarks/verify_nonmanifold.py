@@ -0,0 +1,93 @@
+"""Check the array nonmanifold classifier against BMesh is_manifold on randomized meshes:
+
+    blender -b --factory-startup --python benchmarks/verify_nonmanifold.py -- [--meshes 500] [--seed 0]
+
+Every mesh is a random soup of tris, quads and pentagons over a few verts (so that fans touch, edges
+get three faces and faces come back reversed), with random wire edges, or one of the synthetic
+benchmark meshes with random faces deleted. The exit code is 1 when any vert or edge differs.
+
+The add-on folder has to be named MeshLint, as it is once installed.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Make the MeshLint package and the mesh builders importable without installing the add-on
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import bmesh
+import bpy
+import numpy as np
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintArrays import MeshLintArrays
+from synthetic_meshes import build_mesh, make_cube, make_defects
+
+
+def random_soup(rng, index):
+    num_verts = int(rng.integers(3, 16))
+    faces = []
+    for _ in range(int(rng.integers(1, 14))):
+        size = int(rng.choice((3, 4, 5)))
+        if size > num_verts:
+            continue
+        face = rng.choice(num_verts, size=size, replace=False)
+        if faces and rng.random() < 0.25:
+            face = faces[-1][0][::-1]
+        faces.append(face.reshape(1, -1))
+    if not faces:
+        faces.append(np.arange(3).reshape(1, -1))
+    # A wire edge from a random vert to an extra one, which no face can already use
+    wire_edges = np.array([[int(rng.integers(num_verts)), num_verts]]) if rng.random() < 0.3 else None
+    coords = rng.random((num_verts + 1, 3), dtype=np.float32)
+    return build_mesh(f"soup_{index}", coords, faces, wire_edges)
+
+
+def punched(rng, index):
+    make = make_cube if index % 2 else make_defects
+    mesh = make(int(rng.integers(50, 2000)), seed = index)
+    b = bmesh.new()
+    b.from_mesh(mesh)
+    doomed = [face for face in b.faces if rng.random() < 0.05]
+    bmesh.ops.delete(b, geom=doomed, context='FACES_ONLY')
+    b.to_mesh(mesh)
+    b.free()
+    return mesh
+
+
+def differences(mesh):
+    """Verts and edges where the array classifier and BMesh disagree"""
+    b = bmesh.new()
+    b.from_mesh(mesh)
+    expected = {
+        'verts' : [vvv.index for vvv in b.verts if not vvv.is_manifold],
+        'edges' : [eee.index for eee in b.edges if not eee.is_manifold],
+    }
+    b.free()
+    found = MeshLintArrays(mesh).check_nonmanifold()
+    return {elemtype : sorted(set(expected[elemtype]).symmetric_difference(found[elemtype].tolist()))
+            for elemtype in expected}
+
+
+def main(argv = None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(prog='blender -b --python verify_nonmanifold.py --')
+    parser.add_argument('--meshes', type=int, default=500, help='number of random meshes to compare')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(args.seed)
+    failures = 0
+    for index in range(args.meshes):
+        mesh = punched(rng, index) if index % 10 == 9 else random_soup(rng, index)
+        diff = differences(mesh)
+        if diff['verts'] or diff['edges']:
+            failures += 1
+            sys.stderr.write(f"{mesh.name}: verts {diff['verts']} edges {diff['edges']}\n")
+        bpy.data.meshes.remove(mesh)
+    sys.stderr.write(f"{args.meshes - failures}/{args.meshes} meshes agree with is_manifold\n")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
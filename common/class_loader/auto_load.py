@@ -1,6 +1,8 @@
 import importlib
+import importlib.util
 import inspect
 import pkgutil
+import sys
 import typing
 from pathlib import Path
 
@@ -10,6 +12,7 @@ __all__ = (
     "init",
     "register",
     "unregister",
+    "build_manifest",
     "add_properties",
     "remove_properties",
 )
@@ -18,19 +21,35 @@ from ..types.framework import ExpandableUi, is_extension
 
 blender_version = bpy.app.version
 
+# notice here, the path root is the root of the project
+root_path = Path(__file__).parent.parent.parent
+
 modules = None
 ordered_classes = None
 frame_work_classes = None
+lazy_module_names = None
 
 
-def init():
+def init(manifest=None):
+    """
+    Find the modules and classes to register. Without a manifest every submodule of the project is imported
+    and searched. A manifest is a module holding the result of build_manifest() as MODULES, CLASSES,
+    FRAMEWORK_CLASSES and LAZY_MODULES: only the listed modules are imported, nothing is searched.
+    """
     global modules
     global ordered_classes
     global frame_work_classes
-    # notice here, the path root is the root of the project
-    modules = get_all_submodules(Path(__file__).parent.parent.parent)
+    global lazy_module_names
+    if manifest is not None:
+        modules = [import_submodule(name) for name in manifest.MODULES]
+        ordered_classes = [getattr(import_submodule(name), class_name) for name, class_name in manifest.CLASSES]
+        frame_work_classes = [getattr(import_submodule(name), class_name) for name, class_name in manifest.FRAMEWORK_CLASSES]
+        lazy_module_names = list(manifest.LAZY_MODULES)
+        return
+    modules = get_all_submodules(root_path)
     ordered_classes = get_ordered_classes_to_register(modules)
     frame_work_classes = get_framework_classes(modules)
+    lazy_module_names = []
 
 
 def register():
@@ -56,6 +75,12 @@ def unregister():
         if hasattr(module, "unregister"):
             module.unregister()
 
+    # Modules only imported on first use have nothing to clean up when they were never imported
+    for name in lazy_module_names:
+        module = sys.modules.get(submodule_full_name(name))
+        if module is not None:
+            module.unregister()
+
     for cls in frame_work_classes:
         unregister_framework_class(cls)
 
@@ -68,12 +93,19 @@ def get_all_submodules(directory):
 
 
 def iter_submodules(path):
-    import_as_extension = is_extension()
     for name in sorted(iter_submodule_names(path)):
-        if import_as_extension:
-            yield importlib.import_module("..." + name, __package__)
-        else:
-            yield importlib.import_module("." + name, path.name)
+        yield import_submodule(name)
+
+
+def submodule_full_name(name):
+    # name is relative to the project root, like "addons.MeshLint.config"
+    if is_extension():
+        return importlib.util.resolve_name("..." + name, __package__)
+    return root_path.name + "." + name
+
+
+def import_submodule(name):
+    return importlib.import_module(submodule_full_name(name))
 
 
 def iter_submodule_names(path, root=""):
@@ -204,8 +236,8 @@ def toposort(deps_dict):
             else:
                 unsorted.append(value)
 
-        # sort no dependencies by _reg_order
-        independent.sort(key=lambda x: getattr(x, "_reg_order", float('inf')))
+        # sort no dependencies by _reg_order, then by name so that the order is the same on every run
+        independent.sort(key=lambda x: (getattr(x, "_reg_order", float('inf')), x.__module__, x.__qualname__))
         # add to sorted list
         for value in independent:
             sorted_list.append(value)
@@ -215,6 +247,43 @@ def toposort(deps_dict):
     return sorted_list
 
 
+# Registration manifest
+#################################################
+
+def build_manifest(modules):
+    """
+    Describe the registration of the given modules (the result of a search without manifest) as plain data
+    for init(manifest). MODULES are the modules to import at registration: those defining a class to register
+    or a register() function. Modules with only an unregister() are left to be imported on first use, they are
+    listed as LAZY_MODULES. Classes are (module, class name) pairs, CLASSES in registration order.
+    """
+    prefix = submodule_full_name("_")[:-1]
+    def short_name(module_name):
+        return module_name[len(prefix):]
+
+    def class_entry(cls):
+        return short_name(cls.__module__), cls.__qualname__
+
+    classes = get_ordered_classes_to_register(modules)
+    framework_classes = sorted(get_framework_classes(modules), key=class_entry)
+    defining = {cls.__module__ for cls in classes} | {cls.__module__ for cls in framework_classes}
+    imported = []
+    lazy = []
+    for module in modules:
+        if module.__name__ == __name__:
+            continue
+        if module.__name__ in defining or hasattr(module, "register"):
+            imported.append(short_name(module.__name__))
+        elif hasattr(module, "unregister"):
+            lazy.append(short_name(module.__name__))
+    return {
+        "MODULES": imported,
+        "CLASSES": [class_entry(cls) for cls in classes],
+        "FRAMEWORK_CLASSES": [class_entry(cls) for cls in framework_classes],
+        "LAZY_MODULES": lazy,
+    }
+
+
 def register_framework_class(cls):
     if issubclass(cls, ExpandableUi):
         if hasattr(bpy.types, cls.target_id):
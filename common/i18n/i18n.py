@@ -1,7 +1,7 @@
 import bpy
 
-# Get the language code when addon start up
-__language_code__ = bpy.context.preferences.view.language
+# The language code is read from the preferences on each i18n() call, not when the add-on starts up
+__language_code__ = None
 
 from .dictionary import common_dictionary
 
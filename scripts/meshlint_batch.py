@@ -0,0 +1,16 @@
+"""Lint the meshes of whole .blend libraries from the command line:
+
+    blender -b --factory-startup --python scripts/meshlint_batch.py -- [-o report.jsonl] [--checks tris,ngons] PATH...
+
+The add-on folder has to be named MeshLint, as it is once installed.
+"""
+import sys
+from pathlib import Path
+
+# Make the MeshLint package importable without installing the add-on
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintBatch import main
+
+if __name__ == "__main__":
+    sys.exit(main())
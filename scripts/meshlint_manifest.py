@@ -0,0 +1,73 @@
+"""Write the registration manifest of the add-on, addons/MeshLint/registration_manifest.py:
+
+    blender -b --factory-startup --python scripts/meshlint_manifest.py -- [--check]
+
+Every module is imported and searched once here, so that register() only imports the modules listed in the
+manifest. Run it again after adding, moving or renaming a registered class, a register()/unregister() function
+or a check. With --check nothing is written and the exit code is 1 when the manifest is out of date.
+
+The add-on folder has to be named MeshLint, as it is once installed.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Make the MeshLint package importable without installing the add-on
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from MeshLint.addons.MeshLint.meshLint.MeshLintAnalyzer import MeshLintAnalyzer
+from MeshLint.common.class_loader import auto_load
+
+MANIFEST = Path(__file__).resolve().parents[1] / 'addons' / 'MeshLint' / 'registration_manifest.py'
+HEADER = '''"""Registration manifest of the add-on: register() imports these modules and registers these classes instead of
+searching every module at startup. Generated by scripts/meshlint_manifest.py, do not edit."""'''
+
+
+def render(manifest):
+    """Source of the manifest module, one list item or dict entry per line"""
+    lines = [HEADER]
+    for name, value in manifest.items():
+        lines.append('')
+        if isinstance(value, dict):
+            lines.append(f"{name} = {{")
+            lines.extend(f"    {key!r}: {item!r}," for key, item in value.items())
+            lines.append('}')
+        elif not value:
+            lines.append(f"{name} = []")
+        else:
+            lines.append(f"{name} = [")
+            lines.extend(f"    {item!r}," for item in value)
+            lines.append(']')
+    return '\n'.join(lines) + '\n'
+
+
+def build():
+    auto_load.init()
+    manifest = auto_load.build_manifest(auto_load.modules)
+    manifest['CHECK_PROPERTIES'] = MeshLintAnalyzer.check_properties()
+    return render(manifest)
+
+
+def main(argv = None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog='blender -b --factory-startup --python meshlint_manifest.py --',
+        description='Write the registration manifest of the MeshLint add-on.')
+    parser.add_argument('--check', action='store_true', help='only tell whether the manifest is up to date')
+    args = parser.parse_args(argv)
+    source = build()
+    current = MANIFEST.read_text(encoding='utf-8') if MANIFEST.exists() else None
+    if args.check:
+        if source != current:
+            print(f"{MANIFEST} is out of date, run {Path(__file__).name} again", file=sys.stderr)
+            return 1
+        return 0
+    if source != current:
+        MANIFEST.write_text(source, encoding='utf-8')
+        print(f"Wrote {MANIFEST}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())